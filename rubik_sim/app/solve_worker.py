@@ -7,14 +7,17 @@ from typing import Callable, Optional, List
 from PySide6.QtCore import QThread, Signal
 
 from rubik_sim.core.cube_model import CubeModel
+from rubik_sim.solve.bidir_solver import bidir_solve
 from rubik_sim.solve.iddfs_solver import iddfs_solve
 
 
 class SolveWorker(QThread):
     """Hilo de trabajo para buscar una solución del cubo sin bloquear la UI.
 
-    Ejecuta un solver IDDFS (búsqueda en profundidad iterativa) sobre una copia del estado
-    del cubo, emitiendo señales para informar progreso y resultado.
+    Ejecuta el solver IDDFS (IDA*, compilado con numba si está disponible) sobre una copia
+    del estado del cubo, emitiendo señales para informar progreso y resultado. Opcionalmente
+    usa el BFS bidireccional: más rápido en profundidades medias, pero guarda todos los
+    estados visitados (del orden de 1 GB a profundidad 10).
 
     Signals:
         depth_update(int): Se emite cuando el solver cambia/probara una nueva profundidad.
@@ -26,29 +29,30 @@ class SolveWorker(QThread):
     finished_solution = Signal(object)  # list[str] o None
     error = Signal(str)                 # traceback si algo falla
 
-    def __init__(self, model: CubeModel, max_depth: int) -> None:
+    def __init__(self, model: CubeModel, max_depth: int, bidirectional: bool = False) -> None:
         """Crea el worker y clona el estado del cubo para trabajo en segundo plano.
 
-        Importante: se clona el `state` para evitar condiciones de carrera, ya que la UI
-        puede seguir modificando el cubo original.
+        Importante: se clona el cubo para evitar condiciones de carrera, ya que la UI
+        puede seguir modificando el original.
 
         Args:
             model: Modelo del cubo cuyo estado se quiere resolver.
-            max_depth: Profundidad máxima permitida para la búsqueda IDDFS.
+            max_depth: Largo máximo permitido para la solución.
+            bidirectional: Si True, usa `bidir_solve` en lugar de `iddfs_solve`.
         """
         super().__init__()
-        self.model: CubeModel = CubeModel()
-        # Copia profunda del estado: dict[face] -> list[stickers]
-        self.model.state = {f: list(model.state[f]) for f in model.FACES}
+        self.model: CubeModel = model.copy()
         self.max_depth: int = max_depth
+        self.bidirectional: bool = bidirectional
 
     def run(self) -> None:
         """Punto de entrada del hilo.
 
-        Llama al solver IDDFS y emite el resultado por señales.
+        Llama al solver elegido y emite el resultado por señales.
         """
+        solve = bidir_solve if self.bidirectional else iddfs_solve
         try:
-            sol: Optional[List[str]] = iddfs_solve(
+            sol: Optional[List[str]] = solve(
                 self.model,
                 self.max_depth,
                 on_depth=self.depth_update.emit,
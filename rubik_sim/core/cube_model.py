@@ -1,29 +1,38 @@
 # rubik_sim/core/cube_model.py
 from __future__ import annotations
 
-from typing import Dict, List, Literal, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Literal, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
 
 Face = Literal["U", "D", "L", "R", "F", "B"]
 Color = str  # En tu implementación son letras: "W", "Y", "O", "R", "G", "B"
 Vec3i = Tuple[int, int, int]
-CubeHash = Tuple[Tuple[Color, ...], ...]
+CubeHash = bytes
 
 
 class CubeModel:
     """Modelo lógico del cubo Rubik 3x3 basado en rotaciones geométricas.
 
     Representación:
-        - `state[face]` es una lista de 9 stickers (3x3) para cada cara.
+        - `stickers` es un arreglo uint8 de 54 códigos ASCII de color (cara*9 + índice),
+          con las caras en el orden de `FACES`.
+        - `state[face]` expone la misma información (solo lectura) como tupla de 9 letras
+          por cara; para modificarlo se asigna `state` completo.
         - El orden de stickers por cara corresponde a índices 0..8, en layout fila-columna.
 
     Rotaciones:
         - Se modela cada sticker como un "facelet" con una posición (x,y,z) y una normal.
-        - Al aplicar un giro, se rotan posición y normal y se reubica el color resultante.
+        - Al importar el módulo se rota esa geometría una vez por movimiento y se guarda
+          la permutación resultante (`nuevo[i] = viejo[perm[i]]`); aplicar un giro es
+          un único indexado del arreglo.
 
     Notación de movimientos:
         - Caras: U D L R F B
         - Sufijos:
-            - ""  giro 90° (convención CW según `_apply_base_move_cw`)
+            - ""  giro 90° (convención CW según `_base_move_cw`)
             - "'" giro inverso (equivale a 3 giros CW)
             - "2" giro 180° (2 giros CW)
         - También soporta slices: E M S (según tu convención).
@@ -49,47 +58,116 @@ class CubeModel:
         "D": (0, -1, 0),
     }
 
+    # Mapas: (face, idx) -> (pos, normal) y viceversa (compartidos por todas las instancias)
+    _facelet_to_pn: Dict[Tuple[Face, int], Tuple[Vec3i, Vec3i]] = {}
+    _pn_to_facelet: Dict[Tuple[Vec3i, Vec3i], Tuple[Face, int]] = {}
+
     def __init__(self) -> None:
-        """Inicializa el cubo en estado resuelto y construye los mapas geométricos."""
-        self.state: Dict[Face, List[Color]] = {
-            f: [self.COLORS_SOLVED[f]] * 9 for f in self.FACES
-        }
+        """Inicializa el cubo en estado resuelto."""
+        self._stickers: np.ndarray = _SOLVED_STICKERS.copy()
 
-        # Mapas: (face, idx) -> (pos, normal) y viceversa
-        self._facelet_to_pn: Dict[Tuple[Face, int], Tuple[Vec3i, Vec3i]] = {}
-        self._pn_to_facelet: Dict[Tuple[Vec3i, Vec3i], Tuple[Face, int]] = {}
-        self._build_facelet_maps()
+        # Contador que aumenta cada vez que `apply_move`/`reset` modifican `state`
+        # (permite a la vista detectar cambios sin comparar los 54 stickers).
+        self.state_version: int = 0
 
     # --------------------------
     # Public API
     # --------------------------
+    @property
+    def stickers(self) -> np.ndarray:
+        """Vista de solo lectura de los 54 códigos ASCII de color (caras en orden `FACES`)."""
+        view = self._stickers.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def state(self) -> Mapping[Face, Tuple[Color, ...]]:
+        """Instantánea de solo lectura del estado: tupla de 9 letras de color por cara.
+
+        Escribir en ella falla (`TypeError`); para cambiar el cubo se asigna `state`
+        completo o se usan `apply_move`/`reset`.
+        """
+        letters = self._stickers.tobytes().decode("ascii")
+        return MappingProxyType(
+            {f: tuple(letters[k * 9:(k + 1) * 9]) for k, f in enumerate(self.FACES)}
+        )
+
+    @state.setter
+    def state(self, value: Mapping[Face, Sequence[Color]]) -> None:
+        """Reemplaza el estado a partir de 9 letras de color por cara.
+
+        Args:
+            value: Mapeo cara -> 9 letras de color.
+
+        Raises:
+            ValueError: Si falta alguna cara o no tiene exactamente 9 stickers de una letra ASCII.
+        """
+        faces = []
+        for f in self.FACES:
+            if f not in value:
+                raise ValueError(f"Falta la cara {f!r} en el estado")
+            face = list(value[f])
+            if len(face) != 9 or not all(
+                isinstance(c, str) and len(c) == 1 and c.isascii() and c.isalpha() for c in face
+            ):
+                raise ValueError(f"La cara {f!r} debe tener 9 stickers (una letra ASCII cada uno)")
+            faces.append("".join(face))
+        letters = "".join(faces)
+        self._stickers = np.frombuffer(letters.encode("ascii"), dtype=np.uint8).copy()
+        self.state_version += 1
+
+    def copy(self) -> "CubeModel":
+        """Crea un cubo independiente con el mismo estado (copia directa de los stickers).
+
+        Returns:
+            Nuevo `CubeModel`; modificarlo no afecta a este.
+        """
+        other = CubeModel()
+        other._stickers = self._stickers.copy()
+        return other
+
     def is_solved(self) -> bool:
         """Indica si el cubo está resuelto (cada cara con un solo color).
 
         Returns:
             True si el cubo está resuelto; False en caso contrario.
         """
-        for f in self.FACES:
-            if any(x != self.COLORS_SOLVED[f] for x in self.state[f]):
-                return False
-        return True
+        return self._stickers.tobytes() == _SOLVED_BYTES
+
+    def color_counts(self) -> Dict[Color, int]:
+        """Cuenta los stickers de cada color con un único `np.bincount`.
+
+        Returns:
+            Diccionario color -> cantidad de stickers, para los colores de `COLORS_SOLVED`.
+        """
+        counts = np.bincount(self._stickers, minlength=128)
+        return {color: int(counts[ord(color)]) for color in self.COLORS_SOLVED.values()}
 
     def to_hashable(self) -> CubeHash:
         """Convierte el estado del cubo a una estructura inmutable y hasheable.
 
         Returns:
-            Tupla de tuplas con los 9 stickers por cara, en el orden de `FACES`.
+            Los 54 códigos de color como `bytes`, caras en el orden de `FACES`.
         """
-        return tuple(tuple(self.state[f]) for f in self.FACES)
+        return self._stickers.tobytes()
 
     def apply_sequence(self, seq: str) -> None:
         """Aplica una secuencia de movimientos separada por espacios.
 
+        Compone las permutaciones de todos los movimientos (resultado cacheado por
+        secuencia, ver `_compile_sequence`) y reordena los stickers una sola vez.
+
         Args:
             seq: String con movimientos, por ejemplo: "R U R' U'".
+
+        Raises:
+            ValueError: Si algún movimiento no está soportado (el cubo no cambia).
         """
-        for token in seq.split():
-            self.apply_move(token)
+        perm = _compile_sequence(seq)
+        if perm is None:
+            return
+        self._stickers = self._stickers[perm]
+        self.state_version += 1
 
     def apply_move(self, move: str) -> None:
         """Aplica un movimiento individual al cubo.
@@ -105,34 +183,60 @@ class CubeModel:
         Raises:
             ValueError: Si el movimiento base o sufijo no está soportado.
         """
-        move = move.strip()
-        if not move:
+        if not move.strip():
             return
+        self._stickers = self._stickers[self.move_permutation(move)]
+        self.state_version += 1
+
+    @staticmethod
+    def move_permutation(move: str) -> np.ndarray:
+        """Permutación de stickers precalculada de un movimiento.
+
+        Args:
+            move: Movimiento en notación (por ejemplo: "R", "U'", "F2").
+
+        Returns:
+            Arreglo de 54 índices (no modificar) tal que `nuevo[i] = viejo[perm[i]]`.
 
+        Raises:
+            ValueError: Si el movimiento base o sufijo no está soportado.
+        """
+        perm = _MOVE_PERM.get(move)
+        if perm is not None:
+            return perm
+
+        move = move.strip()
         base = move[0].upper()
         if base not in ("U", "D", "L", "R", "F", "B", "E", "M", "S"):
             raise ValueError(f"Movimiento no soportado: {move}")
 
         suffix = move[1:] if len(move) > 1 else ""
-
-        # turns = cuántas veces aplicar "base CW"
-        turns = 1
-        if suffix == "2":
-            turns = 2
-        elif suffix == "'":
-            turns = 3
-        elif suffix == "":
-            turns = 1
-        else:
+        if suffix not in ("", "'", "2"):
             raise ValueError(f"Sufijo no soportado: {move}")
 
-        for _ in range(turns):
-            self._apply_base_move_cw(base)
+        return _MOVE_PERM[base + suffix]
+
+    @classmethod
+    def corner_facelets(cls) -> List[Tuple[int, int, int]]:
+        """Agrupa los stickers de esquina por pieza.
+
+        Returns:
+            Para cada una de las 8 esquinas, los índices en `stickers` de sus 3 stickers
+            (ordenados de menor a mayor).
+        """
+        by_pos: Dict[Vec3i, List[int]] = {}
+        for k, face in enumerate(cls.FACES):
+            for i in range(9):
+                pos, _ = cls._facelet_to_pn[(face, i)]
+                if all(v != 0 for v in pos):
+                    by_pos.setdefault(pos, []).append(k * 9 + i)
+        return [tuple(sorted(idx)) for _, idx in sorted(by_pos.items())]
 
     # --------------------------
     # Core rotation logic (geométrica)
     # --------------------------
-    def _build_facelet_maps(self) -> None:
+    @classmethod
+    def _build_facelet_maps(cls) -> None:
         """Construye el mapeo entre stickers (facelets) y su representación geométrica.
 
         Debe coincidir con cómo dibujas en OpenGL:
@@ -147,8 +251,8 @@ class CubeModel:
         def idx_rc(i: int) -> Tuple[int, int]:
             return i // 3, i % 3
 
-        for face in self.FACES:
-            n = self.FACE_NORMAL[face]
+        for face in cls.FACES:
+            n = cls.FACE_NORMAL[face]
             for i in range(9):
                 r, c = idx_rc(i)
 
@@ -170,8 +274,8 @@ class CubeModel:
                 key = (face, i)
                 pn = (pos, n)
 
-                self._facelet_to_pn[key] = pn
-                self._pn_to_facelet[(pos, n)] = key
+                cls._facelet_to_pn[key] = pn
+                cls._pn_to_facelet[(pos, n)] = key
 
     @staticmethod
     def _rot_x(v: Vec3i, turns: int) -> Vec3i:
@@ -212,26 +316,27 @@ class CubeModel:
             return (-x, -y, z)
         return (-y, x, z)
 
-    def _rotate_layer(self, axis: Literal["x", "y", "z"], layer_value: int, turns: int) -> None:
-        """Rota una capa del cubo en pasos de 90 grados.
+    @classmethod
+    def _rotate_layer(cls, axis: Literal["x", "y", "z"], layer_value: int, turns: int) -> np.ndarray:
+        """Calcula la permutación de stickers de rotar una capa en pasos de 90 grados.
 
         Args:
             axis: Eje de rotación ('x', 'y' o 'z').
             layer_value: Capa a rotar (-1, 0 o 1).
             turns: Cantidad de cuartos de vuelta (mod 4). Ej: +1, -1, 2, etc.
+
+        Returns:
+            Arreglo de 54 índices tal que `nuevo[i] = viejo[perm[i]]`.
         """
         # Normalizamos turns a [0..3]
         t = turns % 4
 
-        # Copia del estado actual
-        old: Dict[Face, List[Color]] = {f: self.state[f][:] for f in self.FACES}
-        new: Dict[Face, List[Color]] = {f: self.state[f][:] for f in self.FACES}
+        perm = _IDENTITY.copy()
 
         # Recorremos cada facelet y lo rotamos si está en la capa
-        for face in self.FACES:
+        for k, face in enumerate(cls.FACES):
             for i in range(9):
-                color = old[face][i]
-                pos, n = self._facelet_to_pn[(face, i)]
+                pos, n = cls._facelet_to_pn[(face, i)]
                 x, y, z = pos
 
                 select = False
@@ -247,23 +352,24 @@ class CubeModel:
 
                 # Rotar posición + normal
                 if axis == "x":
-                    pos2 = self._rot_x(pos, t)
-                    n2 = self._rot_x(n, t)
+                    pos2 = cls._rot_x(pos, t)
+                    n2 = cls._rot_x(n, t)
                 elif axis == "y":
-                    pos2 = self._rot_y(pos, t)
-                    n2 = self._rot_y(n, t)
+                    pos2 = cls._rot_y(pos, t)
+                    n2 = cls._rot_y(n, t)
                 else:
-                    pos2 = self._rot_z(pos, t)
-                    n2 = self._rot_z(n, t)
+                    pos2 = cls._rot_z(pos, t)
+                    n2 = cls._rot_z(n, t)
 
-                # Ubicar en nueva cara/índice
-                dest_face, dest_i = self._pn_to_facelet[(pos2, n2)]
-                new[dest_face][dest_i] = color
+                # Ubicar en nueva cara/índice: ese sticker toma el color de (face, i)
+                dest_face, dest_i = cls._pn_to_facelet[(pos2, n2)]
+                perm[cls.FACES.index(dest_face) * 9 + dest_i] = k * 9 + i
 
-        self.state = new
+        return perm
 
-    def _apply_base_move_cw(self, base: str) -> None:
-        """Aplica un movimiento base en sentido horario (CW) según tu convención de render.
+    @classmethod
+    def _base_move_cw(cls, base: str) -> np.ndarray:
+        """Permutación de un movimiento base en sentido horario (CW) según tu convención de render.
 
         Convención (coincide con tu render):
         - U: +90 alrededor de +Y en y=+1
@@ -281,30 +387,100 @@ class CubeModel:
         Args:
             base: Movimiento base (U, D, L, R, F, B, M, E, S).
 
+        Returns:
+            Arreglo de 54 índices tal que `nuevo[i] = viejo[perm[i]]`.
+
         Raises:
             ValueError: Si el movimiento base no está soportado.
         """
         if base == "U":
-            self._rotate_layer("y", 1, +1)
-        elif base == "D":
-            self._rotate_layer("y", -1, -1)
-        elif base == "R":
-            self._rotate_layer("x", 1, -1)
-        elif base == "L":
-            self._rotate_layer("x", -1, +1)
-        elif base == "F":
-            self._rotate_layer("z", +1, +1)
-        elif base == "B":
-            self._rotate_layer("z", -1, -1)
-        elif base == "M":
-            self._rotate_layer("x", 0, +1)
-        elif base == "E":
-            self._rotate_layer("y", 0, -1)
-        elif base == "S":
-            self._rotate_layer("z", 0, +1)
-        else:
-            raise ValueError(f"Movimiento no soportado: {base}")
+            return cls._rotate_layer("y", 1, +1)
+        if base == "D":
+            return cls._rotate_layer("y", -1, -1)
+        if base == "R":
+            return cls._rotate_layer("x", 1, -1)
+        if base == "L":
+            return cls._rotate_layer("x", -1, +1)
+        if base == "F":
+            return cls._rotate_layer("z", +1, +1)
+        if base == "B":
+            return cls._rotate_layer("z", -1, -1)
+        if base == "M":
+            return cls._rotate_layer("x", 0, +1)
+        if base == "E":
+            return cls._rotate_layer("y", 0, -1)
+        if base == "S":
+            return cls._rotate_layer("z", 0, +1)
+        raise ValueError(f"Movimiento no soportado: {base}")
 
     def reset(self) -> None:
         """Reinicia el cubo a estado resuelto."""
-        self.state = {f: [self.COLORS_SOLVED[f]] * 9 for f in self.FACES}
+        self._stickers = _SOLVED_STICKERS.copy()
+        self.state_version += 1
+
+
+# --------------------------
+# Tablas precalculadas
+# --------------------------
+def _build_move_table() -> Dict[str, np.ndarray]:
+    """Construye la permutación de cada movimiento soportado (base + sufijo).
+
+    El giro CW se obtiene de la geometría; "2" y "'" componen 2 y 3 giros CW.
+
+    Returns:
+        Diccionario movimiento -> arreglo de 54 índices de solo lectura.
+    """
+    CubeModel._build_facelet_maps()
+    table: Dict[str, np.ndarray] = {}
+    for base in ("U", "D", "L", "R", "F", "B", "E", "M", "S"):
+        cw = CubeModel._base_move_cw(base)
+        # Aplicar `p` y luego `q` equivale a indexar con `p[q]`
+        for suffix, perm in (("", cw), ("2", cw[cw]), ("'", cw[cw][cw])):
+            perm.flags.writeable = False
+            table[base + suffix] = perm
+    return table
+
+
+@lru_cache(maxsize=4096)
+def _compile_sequence(seq: str) -> Optional[np.ndarray]:
+    """Compone en una sola permutación los movimientos de una secuencia.
+
+    Antes de componer se eliminan los pares consecutivos movimiento-inverso
+    (por ejemplo "U U'"), también los que quedan adyacentes al eliminar otros.
+
+    Args:
+        seq: Movimientos separados por espacios.
+
+    Returns:
+        Arreglo de 54 índices de solo lectura, o None si la secuencia no mueve nada
+        (vacía o formada solo por pares que se anulan).
+
+    Raises:
+        ValueError: Si algún movimiento no está soportado.
+    """
+    tokens: List[str] = []
+    for token in seq.split():
+        if tokens and _INVERSE_MOVE.get(tokens[-1]) == token:
+            tokens.pop()
+        else:
+            tokens.append(token)
+    if not tokens:
+        return None
+    perm = _IDENTITY
+    for token in tokens:
+        perm = perm[CubeModel.move_permutation(token)]
+    perm.flags.writeable = False
+    return perm
+
+
+_IDENTITY: np.ndarray = np.arange(54, dtype=np.intp)
+_SOLVED_STICKERS: np.ndarray = np.frombuffer(
+    "".join(CubeModel.COLORS_SOLVED[f] * 9 for f in CubeModel.FACES).encode("ascii"),
+    dtype=np.uint8,
+).copy()
+_SOLVED_BYTES: bytes = _SOLVED_STICKERS.tobytes()
+_MOVE_PERM: Dict[str, np.ndarray] = _build_move_table()
+# Movimiento -> su inverso ("U" <-> "U'", "U2" -> "U2")
+_INVERSE_MOVE: Dict[str, str] = {
+    mv: mv if mv.endswith("2") else (mv[0] if mv.endswith("'") else mv + "'") for mv in _MOVE_PERM
+}
@@ -1,41 +1,77 @@
 # rubik_sim/render/cube_gl_widget.py
 from __future__ import annotations
 
+import ctypes
 import math
-from typing import Dict, List, Literal, Optional, Tuple, Union
+from collections import deque
+from functools import lru_cache
+from typing import Callable, Deque, Dict, List, Literal, Optional, Tuple, Union
 
-from PySide6.QtCore import QPoint, QTimer, Qt, Signal
+import numpy as np
+from PySide6.QtCore import QElapsedTimer, QPoint, QPointF, QTimer, Qt, Signal
 from PySide6.QtGui import QMouseEvent, QWheelEvent
 from PySide6.QtOpenGLWidgets import QOpenGLWidget
 
 from OpenGL.GL import (
-    glBegin,
+    glBindBuffer,
+    glBufferData,
+    glBufferSubData,
     glClear,
     glClearColor,
-    glColor3f,
+    glClientWaitSync,
+    glColorPointer,
+    glCullFace,
+    glDeleteSync,
     glDisable,
+    glDisableClientState,
+    glDrawElements,
     glEnable,
-    glEnd,
+    glEnableClientState,
+    glFenceSync,
     glFlush,
+    glFrontFace,
+    glGenBuffers,
     glLoadIdentity,
+    glLoadMatrixf,
+    glMapBuffer,
     glMatrixMode,
+    glMultiDrawElements,
+    glPopMatrix,
+    glPushMatrix,
     glReadPixels,
     glRotatef,
-    glTranslatef,
-    glVertex3f,
+    glScissor,
+    glUnmapBuffer,
+    glVertexPointer,
     glViewport,
+    GL_ARRAY_BUFFER,
+    GL_BACK,
     GL_BLEND,
+    GL_CCW,
+    GL_COLOR_ARRAY,
     GL_COLOR_BUFFER_BIT,
+    GL_CULL_FACE,
     GL_DEPTH_BUFFER_BIT,
     GL_DEPTH_TEST,
     GL_DITHER,
+    GL_DYNAMIC_DRAW,
+    GL_ELEMENT_ARRAY_BUFFER,
+    GL_FLOAT,
     GL_MODELVIEW,
+    GL_PIXEL_PACK_BUFFER,
     GL_PROJECTION,
-    GL_QUADS,
-    GL_RGB,
+    GL_READ_ONLY,
+    GL_TRIANGLES,
+    GL_RGBA,
+    GL_SCISSOR_TEST,
+    GL_STATIC_DRAW,
+    GL_STREAM_READ,
+    GL_SYNC_GPU_COMMANDS_COMPLETE,
+    GL_TIMEOUT_EXPIRED,
     GL_UNSIGNED_BYTE,
+    GL_UNSIGNED_SHORT,
+    GL_VERTEX_ARRAY,
 )
-from OpenGL.GLU import gluPerspective
 
 from rubik_sim.core.cube_model import CubeModel
 
@@ -43,6 +79,322 @@ Axis = Literal["x", "y", "z"]
 Face = Literal["U", "D", "L", "R", "F", "B"]
 StickerCoord = Tuple[Face, int, int]  # (cara, fila, columna)
 Vec3f = Tuple[float, float, float]
+AnimParams = Tuple[Axis, int, int, float, str]  # (eje, capa, signo, ángulo objetivo, movimiento)
+PickCallback = Callable[[Optional[StickerCoord]], None]
+
+# Orden de caras usado por el render (slot = cara*9 + fila*3 + columna)
+RENDER_FACES: List[Face] = ["F", "B", "R", "L", "U", "D"]
+SLOT_COORDS: List[StickerCoord] = [
+    (f, r, c) for f in RENDER_FACES for r in range(3) for c in range(3)
+]
+SLOT_INDEX: Dict[StickerCoord, int] = {coord: i for i, coord in enumerate(SLOT_COORDS)}
+
+# Intervalo mínimo entre repintados agendados con `_request_update` (~60 fps)
+_FRAME_INTERVAL_MS = 16
+
+# VBO principal: bloques de 54 quads (4 vértices por sticker, en orden de slot)
+_PLASTIC_BASE = 0
+_STICKER_BASE = 54 * 4
+_HIGHLIGHT_BASE = 2 * 54 * 4
+_SCENE_VERTS = 3 * 54 * 4
+# Quads que gira una animación: plástico + stickers (el highlight va aparte)
+_ANIM_QUADS = _HIGHLIGHT_BASE // 4
+_ANIM_INDEX_COUNT = _ANIM_QUADS * 6
+
+
+
+def _rgba8(rgb: Union[Vec3f, np.ndarray]) -> np.ndarray:
+    """Convierte colores RGB en [0, 1] a RGBA uint8 opaco (formato de color del VBO)."""
+    rgb = np.asarray(rgb, dtype=np.float64)
+    alpha = np.ones(rgb.shape[:-1] + (1,))
+    return np.rint(np.concatenate([rgb, alpha], axis=-1) * 255.0).astype(np.uint8)
+
+
+# Colores por vértice: RGBA uint8 (GL_UNSIGNED_BYTE, normalizado por OpenGL)
+_HIGHLIGHT_RGBA: np.ndarray = _rgba8((0.10, 0.95, 0.85))  # calipso
+_PLASTIC_RGBA: np.ndarray = _rgba8((0.05, 0.05, 0.06))
+
+# Paleta RGBA indexada directamente por `ord(letra)`; gris para colores desconocidos
+_COLOR_LUT: np.ndarray = np.full((128, 4), _rgba8((0.8, 0.8, 0.8)), dtype=np.uint8)
+_COLOR_LUT[ord("W")] = _rgba8((1.0, 1.0, 1.0))
+_COLOR_LUT[ord("Y")] = _rgba8((1.0, 1.0, 0.0))
+_COLOR_LUT[ord("O")] = _rgba8((1.0, 0.5, 0.0))
+_COLOR_LUT[ord("R")] = _rgba8((1.0, 0.0, 0.0))
+_COLOR_LUT[ord("G")] = _rgba8((0.0, 0.85, 0.0))
+_COLOR_LUT[ord("B")] = _rgba8((0.0, 0.35, 1.0))
+
+# Geometría de cada cara en orden de RENDER_FACES:
+# (eje normal, signo, eje de columnas, crece con c, eje de filas, crece con r,
+#  invertir el orden de vértices para quedar CCW visto desde fuera)
+_FACE_LAYOUT: Tuple[Tuple[int, float, int, bool, int, bool, bool], ...] = (
+    (2, 1.0, 0, True, 1, False, False),  # F
+    (2, -1.0, 0, False, 1, False, True),  # B
+    (0, 1.0, 2, True, 1, False, True),  # R
+    (0, -1.0, 2, False, 1, False, False),  # L
+    (1, 1.0, 0, True, 2, True, True),  # U
+    (1, -1.0, 0, True, 2, False, False),  # D
+)
+# Esquina (0 = min, 1 = max) de cada vértice del quad en los ejes de columnas/filas;
+# intercambiar ambos patrones recorre el quad en sentido inverso
+_QUAD_U = np.array([0, 1, 1, 0])
+_QUAD_V = np.array([0, 0, 1, 1])
+
+# Eje normal y sentido hacia fuera de cada slot (para el picking por rayo)
+_SLOT_AXIS: np.ndarray = np.repeat([layout[0] for layout in _FACE_LAYOUT], 9)
+_SLOT_SIGN: np.ndarray = np.repeat([layout[1] for layout in _FACE_LAYOUT], 9)
+_SLOT_ROWS: np.ndarray = np.arange(54)
+
+# Índices de triángulos (0,1,2)(0,2,3) por quad, válidos para cualquier VBO de quads
+# consecutivos (escena y picking). Cada quad ocupa 6 índices uint16 (12 bytes).
+_QUAD_TRIANGLES = np.array([0, 1, 2, 0, 2, 3], dtype=np.uint16)
+_SCENE_INDICES: np.ndarray = (
+    np.arange(0, _SCENE_VERTS, 4, dtype=np.uint16)[:, None] + _QUAD_TRIANGLES
+).ravel()
+_QUAD_INDEX_BYTES = 6 * 2
+
+# Vértice de sticker (0..215) -> índice en `CubeModel.stickers` (caras en orden FACES)
+_VERTEX_STICKER: np.ndarray = np.repeat(
+    [CubeModel.FACES.index(f) * 9 + i for f in RENDER_FACES for i in range(9)], 4
+)
+
+# Colores de picking precalculados: fila `pick_id` -> RGBA uint8 que codifica el ID
+_PICK_IDS = np.arange(55, dtype=np.uint32)
+_PICK_RGBA: np.ndarray = np.stack(
+    [_PICK_IDS & 0xFF, (_PICK_IDS >> 8) & 0xFF, (_PICK_IDS >> 16) & 0xFF, np.full(55, 0xFF)],
+    axis=1,
+).astype(np.uint8)
+
+
+def _rotation_x(angle_deg: float) -> np.ndarray:
+    """Matriz 4x4 de rotación alrededor de X (como `glRotatef(angle, 1, 0, 0)`)."""
+    a = math.radians(angle_deg)
+    c, s = math.cos(a), math.sin(a)
+    return np.array(
+        [[1, 0, 0, 0], [0, c, -s, 0], [0, s, c, 0], [0, 0, 0, 1]], dtype=np.float32
+    )
+
+
+def _rotation_y(angle_deg: float) -> np.ndarray:
+    """Matriz 4x4 de rotación alrededor de Y (como `glRotatef(angle, 0, 1, 0)`)."""
+    a = math.radians(angle_deg)
+    c, s = math.cos(a), math.sin(a)
+    return np.array(
+        [[c, 0, s, 0], [0, 1, 0, 0], [-s, 0, c, 0], [0, 0, 0, 1]], dtype=np.float32
+    )
+
+
+def _translation(x: float, y: float, z: float) -> np.ndarray:
+    """Matriz 4x4 de traslación (como `glTranslatef(x, y, z)`)."""
+    m = np.eye(4, dtype=np.float32)
+    m[:3, 3] = (x, y, z)
+    return m
+
+
+def _perspective(fov_deg: float, aspect: float, znear: float, zfar: float) -> np.ndarray:
+    """Matriz 4x4 de proyección en perspectiva (como `gluPerspective`).
+
+    Args:
+        fov_deg: Campo de visión vertical (grados).
+        aspect: Relación ancho/alto del viewport.
+        znear: Distancia al plano cercano (> 0).
+        zfar: Distancia al plano lejano.
+
+    Returns:
+        Matriz 4x4 float32 (convención fila-columna de numpy; transponer para OpenGL).
+    """
+    f = 1.0 / math.tan(math.radians(fov_deg) / 2.0)
+    depth = znear - zfar
+    return np.array(
+        [
+            [f / aspect, 0, 0, 0],
+            [0, f, 0, 0],
+            [0, 0, (zfar + znear) / depth, 2.0 * zfar * znear / depth],
+            [0, 0, -1, 0],
+        ],
+        dtype=np.float32,
+    )
+
+
+def _view_matrix(yaw: float, pitch: float, distance: float) -> np.ndarray:
+    """Matriz de vista de la cámara orbit: T(0, 0, -distance) · Rx(pitch) · Ry(yaw).
+
+    Args:
+        yaw: Yaw de la cámara (grados).
+        pitch: Pitch de la cámara (grados).
+        distance: Distancia de la cámara al centro del cubo.
+
+    Returns:
+        Matriz 4x4 float32 (convención fila-columna de numpy; transponer para OpenGL).
+    """
+    return _translation(0.0, 0.0, -distance) @ _rotation_x(pitch) @ _rotation_y(yaw)
+
+
+_AXIS_INDEX: Dict[Axis, int] = {"x": 0, "y": 1, "z": 2}
+_AXIS_VECTORS: Dict[Axis, Vec3f] = {"x": (1.0, 0.0, 0.0), "y": (0.0, 1.0, 0.0), "z": (0.0, 0.0, 1.0)}
+
+# Movimiento base -> (eje, capa, signo base) para la animación
+_MOVE_TABLE: Dict[str, Tuple[Axis, int, int]] = {
+    "U": ("y",  1, +1),
+    "D": ("y", -1, -1),
+    "R": ("x",  1, -1),
+    "L": ("x", -1, +1),
+    "F": ("z",  1, -1),
+    "B": ("z", -1, +1),
+    "M": ("x",  0, +1),
+    "E": ("y",  0, -1),
+    "S": ("z",  0, -1),
+}
+
+# Selector (0 = min, 1 = max) por eje de las 8 esquinas de una caja
+_BOX_CORNERS: np.ndarray = np.array(
+    [[(k >> 2) & 1, (k >> 1) & 1, k & 1] for k in range(8)], dtype=bool
+)
+
+
+def _ray_hit_slot(
+    origin: np.ndarray,
+    direction: np.ndarray,
+    lo: np.ndarray,
+    hi: np.ndarray,
+    eps: float = 1e-6,
+) -> int:
+    """Intersecta un rayo con los 54 quads (alineados a los ejes) de los stickers.
+
+    Args:
+        origin: Origen del rayo (3,).
+        direction: Dirección del rayo (3,), no necesariamente normalizada.
+        lo: Esquinas mínimas de cada quad (54, 3), en orden de slot.
+        hi: Esquinas máximas de cada quad (54, 3), en orden de slot.
+        eps: Tolerancia de los tests de contención.
+
+    Returns:
+        Slot (0..53) del quad de cara frontal más cercano alcanzado, o -1 si ninguno.
+    """
+    d_n = direction[_SLOT_AXIS]
+    # Solo caras frontales (como el culling del render)
+    front = d_n * _SLOT_SIGN < 0.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (lo[_SLOT_ROWS, _SLOT_AXIS] - origin[_SLOT_AXIS]) / d_n
+        hits = origin + t[:, None] * direction
+        inside = front & (t > 0.0) & np.all((hits >= lo - eps) & (hits <= hi + eps), axis=1)
+    if not inside.any():
+        return -1
+    return int(np.argmin(np.where(inside, t, np.inf)))
+
+
+@lru_cache(maxsize=None)
+def _pick_offsets(radius: int) -> Tuple[Tuple[int, int], ...]:
+    """Desplazamientos (dx, dy) del cuadrado de radio `radius`, del más cercano al centro."""
+    offsets = [(dx, dy) for dy in range(-radius, radius + 1) for dx in range(-radius, radius + 1)]
+    return tuple(sorted(offsets, key=lambda o: o[0] * o[0] + o[1] * o[1]))
+
+
+def _nearest_pick_id(pixels: bytes, w: int, h: int, cx: int, cy: int) -> int:
+    """Elige el ID de picking válido más cercano al cursor en un rectángulo leído.
+
+    Args:
+        pixels: `w*h` píxeles RGBA uint8 del pase de picking (filas de abajo a arriba).
+        w: Ancho del rectángulo.
+        h: Alto del rectángulo.
+        cx: Columna del cursor dentro del rectángulo.
+        cy: Fila del cursor dentro del rectángulo.
+
+    Returns:
+        pick_id (1..54) más cercano al cursor, o 0 si no hay ninguno.
+    """
+    px = np.frombuffer(pixels, dtype=np.uint8, count=w * h * 4).reshape(h, w, 4).astype(np.int32)
+    ids = px[..., 0] | (px[..., 1] << 8) | (px[..., 2] << 16)
+    valid = (ids > 0) & (ids < len(_PICK_IDS))
+    if not valid.any():
+        return 0
+    ys, xs = np.ogrid[:h, :w]
+    dist = np.where(valid, (xs - cx) ** 2 + (ys - cy) ** 2, np.iinfo(np.int32).max)
+    return int(ids.flat[int(np.argmin(dist))])
+
+
+_FACE_NORMAL: Dict[Face, Vec3f] = {
+    "F": (0.0, 0.0, 1.0),
+    "B": (0.0, 0.0, -1.0),
+    "R": (1.0, 0.0, 0.0),
+    "L": (-1.0, 0.0, 0.0),
+    "U": (0.0, 1.0, 0.0),
+    "D": (0.0, -1.0, 0.0),
+}
+
+# Decodificación de `_drag_move_code`: índice = eje*6 + (capa+1)*2 + (0 si giro + / 1 si giro -)
+# (convención del CubeModel geométrico)
+_DRAG_MOVES: Tuple[str, ...] = (
+    "L", "L'", "M", "M'", "R'", "R",  # eje x, capas -1, 0, 1
+    "D'", "D", "E'", "E", "U", "U'",  # eje y
+    "B", "B'", "S'", "S", "F'", "F",  # eje z
+)
+
+
+def _cross(a: Vec3f, b: Vec3f) -> Vec3f:
+    return (
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0],
+    )
+
+
+def _dot(a: Vec3f, b: Vec3f) -> float:
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _world_to_cube(yaw_deg: float, pitch_deg: float) -> np.ndarray:
+    """Rotación 3x3 mundo -> cubo (inversa de la rotación de cámara): Ry(-yaw) · Rx(-pitch).
+
+    Args:
+        yaw_deg: Yaw de la cámara (grados).
+        pitch_deg: Pitch de la cámara (grados).
+
+    Returns:
+        Matriz float64 `M` tal que `d_cubo = M @ d_mundo`.
+    """
+    yaw = math.radians(yaw_deg)
+    pitch = math.radians(pitch_deg)
+    cx, sx = math.cos(-pitch), math.sin(-pitch)
+    cy, sy = math.cos(-yaw), math.sin(-yaw)
+    return np.array([[cy, 0.0, sy], [0.0, 1.0, 0.0], [-sy, 0.0, cy]]) @ np.array(
+        [[1.0, 0.0, 0.0], [0.0, cx, -sx], [0.0, sx, cx]]
+    )
+
+
+def _drag_move_code(n: Vec3f, p: Vec3f, d_cube: Vec3f) -> int:
+    """Núcleo numérico del drag: decide eje, capa y sentido del giro.
+
+    Args:
+        n: Normal de la cara donde empezó el drag.
+        p: Centro del sticker.
+        d_cube: Dirección del drag ya llevada a coordenadas del cubo.
+
+    Returns:
+        Índice en `_DRAG_MOVES`, o -1 si no se puede decidir.
+    """
+    # proyectar al plano de la cara
+    k = _dot(d_cube, n)
+    d_plane: Vec3f = (d_cube[0] - n[0] * k, d_cube[1] - n[1] * k, d_cube[2] - n[2] * k)
+    if math.sqrt(_dot(d_plane, d_plane)) < 1e-6:
+        return -1
+
+    axis = _cross(n, d_plane)
+
+    ax = [abs(axis[0]), abs(axis[1]), abs(axis[2])]
+    i = ax.index(max(ax))
+    axis_sign = 1 if axis[i] > 0 else (-1 if axis[i] < 0 else 0)
+
+    layer = int(round(p[i]))
+    if layer not in (-1, 0, 1):
+        return -1
+
+    axis_unit = [0.0, 0.0, 0.0]
+    axis_unit[i] = float(axis_sign)
+    v = _cross((axis_unit[0], axis_unit[1], axis_unit[2]), p)
+    rot_about_axis_unit = 1 if _dot(v, d_plane) > 0 else -1
+    rot_about_pos = rot_about_axis_unit * axis_sign
+
+    return i * 6 + (layer + 1) * 2 + (0 if rot_about_pos == 1 else 1)
 
 
 class CubeGLWidget(QOpenGLWidget):
@@ -51,10 +403,10 @@ class CubeGLWidget(QOpenGLWidget):
     Características:
     - Render OpenGL clásico (sin shaders).
     - Stickers 3x3 (y “plástico” detrás).
-    - Picking por color (funciona con HiDPI).
+    - Picking por rayo en CPU (opcional: color picking en GPU con `gpu_picking`).
     - Highlight del sticker seleccionado.
     - Drag “camera-aware” que decide el movimiento por capa (incluye E/M/S).
-    - Animación suave usando QTimer.
+    - Animación guiada por `frameSwapped` (al ritmo del vsync), con un QTimer de respaldo.
     """
 
     move_applied = Signal(str)
@@ -69,13 +421,35 @@ class CubeGLWidget(QOpenGLWidget):
         super().__init__(parent)
         self.model: CubeModel = model
 
-        # Cámara / orbit
-        self.yaw: float = 35.0
-        self.pitch: float = -20.0
-        self.distance: float = 6.0
-
-        self._last_mouse_pos: QPoint = QPoint()
+        # Cámara / orbit (`yaw`, `pitch` y `distance` son propiedades que marcan la
+        # matriz de vista como sucia)
+        self._yaw: float = 35.0
+        self._pitch: float = -20.0
+        self._distance: float = 6.0
+
+        # Matriz de vista cacheada, su inversa (float64, para el picking por rayo) y su
+        # copia column-major para `glLoadMatrixf`; se recomponen en `_camera_view`
+        # solo si la cámara cambió
+        self._view_dirty: bool = True
+        self._view: np.ndarray = np.eye(4, dtype=np.float32)
+        self._view_inv: np.ndarray = np.eye(4, dtype=np.float64)
+        self._view_gl: np.ndarray = np.eye(4, dtype=np.float32)
+        # Rotación mundo -> cubo para el drag (misma invalidación que la vista)
+        self._world_to_cube: np.ndarray = np.eye(3, dtype=np.float64)
+        # Caja en pantalla (px de framebuffer) de la geometría de picking: clicks fuera
+        # de ella no pueden tocar ningún sticker. Se invalida con la vista y el viewport.
+        self._screen_bbox: Optional[Tuple[float, float, float, float]] = None
+        self._screen_bbox_dirty: bool = True
+
+        # Repintado diferido: como máximo un `update()` en cola y uno por frame (~16 ms)
+        self._update_pending: bool = False
+        self._last_update: QElapsedTimer = QElapsedTimer()
+
+        self._last_mouse_pos: QPointF = QPointF()
         self._orbiting: bool = False
+        # Desplazamiento de orbit acumulado (px) aún no aplicado a la cámara
+        self._orbit_dx: float = 0.0
+        self._orbit_dy: float = 0.0
 
         # Stickers
         self.sticker_margin: float = 0.04
@@ -98,12 +472,94 @@ class CubeGLWidget(QOpenGLWidget):
         self.anim_sign: int = 1                    # +1 o -1
         self.anim_angle: float = 0.0
         self.anim_target: float = 90.0
-        self.anim_step: float = 6.0               # deg/frame
-
-        self._move_queue: List[str] = []
+        self.anim_step_per_ms: float = 90.0 / 250.0  # deg/ms (250 ms por cuarto de vuelta)
+
+        # Cola de movimientos pendientes, ya traducidos a parámetros de animación
+        self._move_queue: Deque[AnimParams] = deque()
+        # Slots de la capa animada (máscara por slot): fijos durante todo un movimiento,
+        # se calculan en `start_move_animation`
+        self._anim_slot_mask: np.ndarray = np.zeros(54, dtype=bool)
+        # Índices de plástico + stickers reordenados para el movimiento en curso:
+        # [quads fijos | quads de la capa animada]. La capa se dibuja aparte con
+        # `glRotatef`, así que las posiciones del VBO nunca cambian.
+        self._anim_ebo: int = 0
+        self._anim_indices: np.ndarray = np.empty(0, dtype=np.uint16)
+        self._anim_split: int = 0
+        self._anim_indices_dirty: bool = False
+        # La animación avanza tras cada frame presentado (`frameSwapped`), al ritmo real
+        # de la pantalla. El timer es solo un respaldo lento para que el movimiento
+        # termine aunque no se presenten frames (ventana oculta o minimizada).
         self._anim_timer: QTimer = QTimer(self)
-        self._anim_timer.setInterval(16)  # ~60fps
+        self._anim_timer.setInterval(100)
+        # Reloj del movimiento en curso: el ángulo se deriva del tiempo real transcurrido
+        # (no de cuántos ticks han llegado), así el jitter del timer no altera la duración
+        self._anim_elapsed: QElapsedTimer = QElapsedTimer()
+        # Tiempo (ms) que el movimiento ya llevaba al arrancar su reloj: lo que sobró del
+        # movimiento anterior de la cola, para encadenarlos sin pausas
+        self._anim_carry_ms: float = 0.0
         self._anim_timer.timeout.connect(self._on_anim_tick)
+        self.frameSwapped.connect(self._on_frame_swapped)
+
+        # Proyección en perspectiva y tamaño del framebuffer (se recalculan en resizeGL)
+        self._proj: np.ndarray = np.eye(4, dtype=np.float32)
+        self._proj_inv: np.ndarray = np.eye(4, dtype=np.float64)
+        self._viewport: Tuple[int, int] = (1, 1)
+
+        # Colores RGBA uint8 por vértice de sticker (216x4), derivados de `model.state`.
+        # `_colors_version` guarda el `model.state_version` ya subido al VBO.
+        self._sticker_rgba: np.ndarray = np.empty((54 * 4, 4), dtype=np.uint8)
+        self._colors_version: int = -1
+
+        # Picking: mapa pick_id -> sticker (fijo) y VBOs estáticos (se crean en initializeGL)
+        self._pick_mapping: Dict[int, StickerCoord] = {
+            i + 1: coord for i, coord in enumerate(SLOT_COORDS)
+        }
+        self._pick_pos_vbo: int = 0
+        self._pick_color_vbo: int = 0
+        # Picking por rayo en CPU (por defecto): límites (min, max) de los quads de picking.
+        # `gpu_picking` activa el pase de color picking con glReadPixels.
+        self.gpu_picking: bool = False
+        self._pick_lo: np.ndarray = np.zeros((54, 3), dtype=np.float64)
+        self._pick_hi: np.ndarray = np.zeros((54, 3), dtype=np.float64)
+        # Color picking asíncrono: dos PBOs alternados y la lectura pendiente
+        self._pick_pbos: List[int] = []
+        self._pick_pbo_index: int = 0
+        # (pbo, ancho, alto, cursor_x, cursor_y, fence, callback) de la lectura pendiente;
+        # `_pick_poll_timer` consulta el fence sin bloquear hasta que la GPU termina
+        self._pick_pending: Optional[
+            Tuple[int, Tuple[int, int, int, int], int, int, object, PickCallback]
+        ] = None
+        self._pick_poll_timer: QTimer = QTimer(self)
+        self._pick_poll_timer.setInterval(4)
+        self._pick_poll_timer.timeout.connect(self._poll_pending_pick)
+
+        # Escena: un VBO con [posiciones | colores] de highlight, plástico y stickers
+        self._scene_vbo: int = 0
+        self._scene_positions: np.ndarray = np.empty((_SCENE_VERTS, 3), dtype=np.float32)
+        # Capa (-1, 0, 1) de cada slot en los ejes x, y, z (= centro del sticker): la
+        # máscara de la capa animada es una sola comparación vectorizada
+        self._slot_layers: np.ndarray = np.array(
+            [self._sticker_center(*coord) for coord in SLOT_COORDS], dtype=np.int8
+        )
+
+        # Índices de triángulos compartidos por escena y picking (EBO estático)
+        self._index_ebo: int = 0
+
+        # Rangos (offset en bytes del EBO, nº de índices) del único draw de la escena:
+        # plástico + stickers, highlight
+        self._draw_offsets: np.ndarray = np.array(
+            [_PLASTIC_BASE // 4 * _QUAD_INDEX_BYTES, _HIGHLIGHT_BASE // 4 * _QUAD_INDEX_BYTES],
+            dtype=np.intp,
+        )
+        self._draw_count: np.ndarray = np.array(
+            [(_HIGHLIGHT_BASE - _PLASTIC_BASE) // 4 * 6, 0], dtype=np.int32
+        )
+
+        # Frame ya dibujado: clave de lo visible (ver `_scene_key`). Con PartialUpdate
+        # el framebuffer se conserva entre frames, así que un paintGL sin cambios no
+        # necesita redibujar nada.
+        self._drawn_key: Optional[tuple] = None
+        self.setUpdateBehavior(QOpenGLWidget.PartialUpdate)
 
         self.setFocusPolicy(Qt.ClickFocus)
 
@@ -111,9 +567,79 @@ class CubeGLWidget(QOpenGLWidget):
     # OpenGL lifecycle
     # --------------------------
     def initializeGL(self) -> None:
-        """Inicializa parámetros OpenGL (clear color y depth test)."""
+        """Inicializa parámetros OpenGL (clear color, depth test) y buffers estáticos."""
         glClearColor(0.10, 0.10, 0.12, 1.0)
         glEnable(GL_DEPTH_TEST)
+        self._drawn_key = None
+
+        # Todos los quads están en sentido antihorario vistos desde fuera del cubo
+        glEnable(GL_CULL_FACE)
+        glCullFace(GL_BACK)
+        glFrontFace(GL_CCW)
+
+        # Geometría y colores del pase de picking: nunca cambian
+        pick_pos = self._build_quads(self.sticker_margin + 0.03)
+        pick_rgba = np.repeat(_PICK_RGBA[1:55], 4, axis=0)
+        self._pick_pos_vbo = self._upload_static_vbo(pick_pos)
+        self._pick_color_vbo = self._upload_static_vbo(pick_rgba)
+        # PBOs de lectura: se dimensionan en cada `_begin_pick_gpu`
+        self._pick_pbos = [int(pbo) for pbo in glGenBuffers(2)]
+        self._pick_pending = None
+
+        pick_quads = pick_pos.reshape(54, 4, 3).astype(np.float64)
+        self._pick_lo = pick_quads.min(axis=1)
+        self._pick_hi = pick_quads.max(axis=1)
+
+        self._index_ebo = int(glGenBuffers(1))
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self._index_ebo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, _SCENE_INDICES.nbytes, _SCENE_INDICES, GL_STATIC_DRAW)
+        # EBO de la animación: se rellena al dibujar el primer frame de cada movimiento
+        self._anim_ebo = int(glGenBuffers(1))
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self._anim_ebo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, _ANIM_INDEX_COUNT * 2, None, GL_DYNAMIC_DRAW)
+        self._anim_indices_dirty = self.animating
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+        # Escena: la geometría es estática; solo cambian los colores de los stickers.
+        pos = np.empty((_SCENE_VERTS, 3), dtype=np.float32)
+        # Plástico: celdas completas sobre la superficie del cubo, formando una cáscara
+        # cerrada (sin huecos por los que se vería el fondo al descartar caras traseras)
+        self._build_quads(0.0, 0.0, out=pos[_PLASTIC_BASE:_STICKER_BASE])
+        self._build_quads(self.sticker_margin, out=pos[_STICKER_BASE:_HIGHLIGHT_BASE])
+        # Highlight: algo más grande y delante del sticker (sin z-fighting)
+        self._build_quads(
+            self.sticker_margin * 0.35, self.sticker_offset * 1.5, out=pos[_HIGHLIGHT_BASE:]
+        )
+        self._scene_positions = pos
+        colors = np.zeros((_SCENE_VERTS, 4), dtype=np.uint8)
+        colors[_PLASTIC_BASE:_STICKER_BASE] = _PLASTIC_RGBA
+        colors[_HIGHLIGHT_BASE:] = _HIGHLIGHT_RGBA
+
+        self._scene_vbo = int(glGenBuffers(1))
+        glBindBuffer(GL_ARRAY_BUFFER, self._scene_vbo)
+        pos_bytes = self._scene_positions.nbytes
+        glBufferData(GL_ARRAY_BUFFER, pos_bytes + colors.nbytes, None, GL_DYNAMIC_DRAW)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, pos_bytes, self._scene_positions)
+        glBufferSubData(GL_ARRAY_BUFFER, pos_bytes, colors.nbytes, colors)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self._colors_version = -1
+
+    @staticmethod
+    def _upload_static_vbo(data: np.ndarray) -> int:
+        """Crea un VBO y sube `data` una sola vez (GL_STATIC_DRAW).
+
+        Args:
+            data: Arreglo contiguo (posiciones float32 o colores uint8).
+
+        Returns:
+            Identificador del buffer OpenGL.
+        """
+        data = np.ascontiguousarray(data)
+        vbo = int(glGenBuffers(1))
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        return vbo
 
     def resizeGL(self, w: int, h: int) -> None:
         """Ajusta viewport y proyección cuando cambia el tamaño del widget.
@@ -130,33 +656,105 @@ class CubeGLWidget(QOpenGLWidget):
         fb_h = int(h * dpr)
 
         glViewport(0, 0, fb_w, fb_h)
+        self._viewport = (fb_w, fb_h)
+        self._drawn_key = None
+        self._screen_bbox_dirty = True
 
         glMatrixMode(GL_PROJECTION)
         glLoadIdentity()
         aspect = fb_w / float(fb_h)
-        gluPerspective(45.0, aspect, 0.1, 100.0)
+        self._proj = _perspective(45.0, aspect, 0.1, 100.0)
+        self._proj_inv = np.linalg.inv(self._proj.astype(np.float64))
+        glLoadMatrixf(np.ascontiguousarray(self._proj.T))
 
         glMatrixMode(GL_MODELVIEW)
         glLoadIdentity()
 
     def paintGL(self) -> None:
-        """Dibuja el frame actual del cubo (stickers + animación)."""
+        """Dibuja el frame actual del cubo (stickers + animación).
+
+        Si nada visible cambió desde el último frame (misma `_scene_key`), no
+        redibuja: el framebuffer conserva ese frame.
+        """
+        key = self._scene_key()
+        if key == self._drawn_key:
+            return
+
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
 
         self._apply_camera()
-
-        # Stickers: primero NO animados, luego animados encima
-        self._draw_stickers_pass(animated_only=False)
-        if self.animating:
-            self._draw_stickers_pass(animated_only=True)
+        self._draw_scene()
+        self._drawn_key = key
+
+    def _scene_key(self) -> tuple:
+        """Clave de todo lo que afecta al frame: estado, cámara, animación y selección."""
+        return (
+            self.model.state_version,
+            self._yaw,
+            self._pitch,
+            self._distance,
+            self.anim_move,
+            self.anim_angle,
+            self.selected,
+        )
 
     def _apply_camera(self) -> None:
-        """Aplica la transformación de cámara (orbit) al modelo."""
+        """Aplica la transformación de cámara (orbit) al modelo.
+
+        Carga la matriz de vista cacheada con un solo `glLoadMatrixf`; solo se
+        recompone si la cámara cambió desde el último frame.
+        """
+        self._camera_view()
         glMatrixMode(GL_MODELVIEW)
-        glLoadIdentity()
-        glTranslatef(0.0, 0.0, -self.distance)
-        glRotatef(self.pitch, 1.0, 0.0, 0.0)
-        glRotatef(self.yaw, 0.0, 1.0, 0.0)
+        glLoadMatrixf(self._view_gl)
+
+    def _camera_view(self) -> np.ndarray:
+        """Matriz de vista actual (y su inversa), recompuesta solo si la cámara cambió.
+
+        Returns:
+            Matriz 4x4 float32 de vista (convención fila-columna de numpy).
+        """
+        if self._view_dirty:
+            self._view = _view_matrix(self._yaw, self._pitch, self._distance)
+            self._view_inv = np.linalg.inv(self._view.astype(np.float64))
+            self._view_gl = np.ascontiguousarray(self._view.T)
+            self._world_to_cube = _world_to_cube(self._yaw, self._pitch)
+            self._view_dirty = False
+            self._screen_bbox_dirty = True
+        return self._view
+
+    # --------------------------
+    # Cámara
+    # --------------------------
+    @property
+    def yaw(self) -> float:
+        """Yaw de la cámara (grados)."""
+        return self._yaw
+
+    @yaw.setter
+    def yaw(self, value: float) -> None:
+        self._yaw = value
+        self._view_dirty = True
+
+    @property
+    def pitch(self) -> float:
+        """Pitch de la cámara (grados)."""
+        return self._pitch
+
+    @pitch.setter
+    def pitch(self, value: float) -> None:
+        self._pitch = value
+        self._view_dirty = True
+
+    @property
+    def distance(self) -> float:
+        """Distancia de la cámara al centro del cubo."""
+        return self._distance
+
+    @distance.setter
+    def distance(self, value: float) -> None:
+        self._distance = value
+        self._view_dirty = True
 
     # --------------------------
     # Interacción
@@ -169,35 +767,51 @@ class CubeGLWidget(QOpenGLWidget):
         """
         if event.button() == Qt.RightButton:
             self._orbiting = True
-            self._last_mouse_pos = event.pos()
+            self._last_mouse_pos = event.position()
+            self._orbit_dx = self._orbit_dy = 0.0
             event.accept()
             return
 
         if event.button() == Qt.LeftButton:
-            hit = self.pick_sticker(event.pos().x(), event.pos().y())
-            self.selected = hit
             self._dragging_left = True
             self._drag_start = event.pos()
-            self._drag_hit = hit
 
-            if hit:
-                face, r, c = hit
-                msg = f"Seleccionado: {face} (fila={r}, col={c})"
-            else:
-                msg = "Sin selección."
-
-            w = self.window()
-            if hasattr(w, "statusBar") and w.statusBar():
-                w.statusBar().showMessage(msg, 2000)
-            else:
-                print(msg)
-
-            self.update()
+            # Hasta resolver el picking (inmediato en CPU, asíncrono en GPU) no hay drag
+            self._drag_hit = None
+            self.pick_sticker_async(event.pos().x(), event.pos().y(), self._on_press_pick)
             event.accept()
             return
 
         super().mousePressEvent(event)
 
+    def _on_press_pick(self, hit: Optional[StickerCoord]) -> None:
+        """Aplica el picking del click izquierdo y repinta solo si cambió el highlight."""
+        prev = self.selected
+        self._apply_pick(hit)
+        if self.selected != prev:
+            self.update()
+
+    def _apply_pick(self, hit: Optional[StickerCoord]) -> None:
+        """Aplica el resultado de un picking: selección, inicio de drag y mensaje.
+
+        Args:
+            hit: Sticker bajo el cursor o None.
+        """
+        self.selected = hit
+        self._drag_hit = hit
+
+        if hit:
+            face, r, c = hit
+            msg = f"Seleccionado: {face} (fila={r}, col={c})"
+        else:
+            msg = "Sin selección."
+
+        w = self.window()
+        if hasattr(w, "statusBar") and w.statusBar():
+            w.statusBar().showMessage(msg, 2000)
+        else:
+            print(msg)
+
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
         """Maneja movimiento del mouse: orbit (derecho) o drag (izquierdo) para mover capas.
 
@@ -206,16 +820,20 @@ class CubeGLWidget(QOpenGLWidget):
         """
         # Orbit
         if self._orbiting:
-            dx = event.position().x() - self._last_mouse_pos.x()
-            dy = event.position().y() - self._last_mouse_pos.y()
-            self._last_mouse_pos = event.pos()
-
-            sens = 0.4
-            self.yaw += dx * sens
-            self.pitch += dy * sens
-            self.pitch = max(-89.0, min(89.0, self.pitch))
-
-            self.update()
+            pos = event.position()
+            self._orbit_dx += pos.x() - self._last_mouse_pos.x()
+            self._orbit_dy += pos.y() - self._last_mouse_pos.y()
+            self._last_mouse_pos = pos
+
+            # Deltas sub-píxel (touchpads): acumular hasta que el cambio sea visible
+            if abs(self._orbit_dx) + abs(self._orbit_dy) > 0.5:
+                sens = 0.4
+                self._set_camera(
+                    self.yaw + self._orbit_dx * sens,
+                    self.pitch + self._orbit_dy * sens,
+                    self.distance,
+                )
+                self._orbit_dx = self._orbit_dy = 0.0
             event.accept()
             return
 
@@ -274,16 +892,62 @@ class CubeGLWidget(QOpenGLWidget):
             event: Evento de rueda de Qt.
         """
         delta = event.angleDelta().y() / 120.0
-        self.distance -= delta * 0.3
-        self.distance = max(2.5, min(20.0, self.distance))
-        self.update()
+        self._set_camera(self.yaw, self.pitch, self.distance - delta * 0.3)
         event.accept()
 
+    def _set_camera(self, yaw: float, pitch: float, distance: float) -> None:
+        """Actualiza la cámara (con límites) y repinta solo si realmente cambió.
+
+        La matriz de vista se recompone de forma perezosa en el siguiente uso.
+
+        Args:
+            yaw: Nuevo yaw (grados).
+            pitch: Nuevo pitch (grados); se limita a [-89, 89].
+            distance: Nueva distancia; se limita a [2.5, 20].
+        """
+        pitch = max(-89.0, min(89.0, pitch))
+        distance = max(2.5, min(20.0, distance))
+        if (yaw, pitch, distance) == (self.yaw, self.pitch, self.distance):
+            return
+
+        self.yaw = yaw
+        self.pitch = pitch
+        self.distance = distance
+        self._request_update()
+
+    def _request_update(self) -> None:
+        """Agenda un repintado, agrupando ráfagas de eventos de entrada (mouse/rueda).
+
+        Si el último repintado fue hace menos de un frame, el nuevo se difiere hasta
+        completar `_FRAME_INTERVAL_MS`.
+
+        Los frames de animación no pasan por aquí a propósito: `_on_anim_tick` llama a
+        `update()` directamente y su ritmo lo marcan `frameSwapped` y el vsync.
+        """
+        if self._update_pending:
+            return
+        self._update_pending = True
+        wait = 0
+        if self._last_update.isValid():
+            wait = max(0, _FRAME_INTERVAL_MS - self._last_update.elapsed())
+        QTimer.singleShot(wait, self._flush_update)
+
+    def _flush_update(self) -> None:
+        """Slot del timer de `_request_update`: emite el `update()` pendiente."""
+        self._update_pending = False
+        self._last_update.start()
+        self.update()
+
     # --------------------------
     # Picking (color picking)
     # --------------------------
     def pick_sticker(self, x: int, y: int) -> Optional[StickerCoord]:
-        """Detecta qué sticker se encuentra bajo el cursor usando color picking.
+        """Detecta qué sticker se encuentra bajo el cursor.
+
+        Por defecto intersecta en CPU el rayo del cursor con los 54 quads de picking
+        (sin render ni lectura del framebuffer); con `gpu_picking` usa color picking.
+        En ambos casos se tolera un radio de `_pick_radius` píxeles (HiDPI/táctil):
+        gana el sticker más cercano al cursor.
 
         Args:
             x: Coordenada X en píxeles (Qt, coordenadas del widget).
@@ -295,56 +959,262 @@ class CubeGLWidget(QOpenGLWidget):
         if self.animating:
             return None
 
+        gl_x, gl_y = self._gl_pixel(x, y)
+        if self._outside_cube_on_screen(gl_x, gl_y):
+            return None
+        if self.gpu_picking:
+            return self._pick_sticker_gpu(gl_x, gl_y)
+        return self._pick_sticker_cpu(gl_x, gl_y)
+
+    def _pick_sticker_cpu(self, gl_x: int, gl_y: int) -> Optional[StickerCoord]:
+        """Picking por rayo en CPU (ver `pick_sticker`).
+
+        Args:
+            gl_x: Columna del píxel en el framebuffer.
+            gl_y: Fila del píxel en el framebuffer.
+
+        Returns:
+            Tupla (cara, fila, columna) del sticker bajo el cursor, o None.
+        """
+        # Rayo por el cursor; si no acierta, por los píxeles vecinos (del más cercano
+        # al más lejano) dentro del radio de tolerancia
+        fb_w, fb_h = self._viewport
+        for ox, oy in _pick_offsets(self._pick_radius()):
+            px, py = gl_x + ox, gl_y + oy
+            if not (0 <= px < fb_w and 0 <= py < fb_h):
+                continue
+            origin, direction = self._pick_ray(px, py)
+            slot = _ray_hit_slot(origin, direction, self._pick_lo, self._pick_hi)
+            if slot >= 0:
+                return SLOT_COORDS[slot]
+        return None
+
+    def pick_sticker_async(self, x: int, y: int, callback: PickCallback) -> None:
+        """Como `pick_sticker`, pero entrega el resultado a `callback` sin bloquear.
+
+        Con picking por rayo (o durante una animación) `callback` se invoca de
+        inmediato. Con `gpu_picking` la lectura va a un PBO con un fence y `callback`
+        se invoca cuando la GPU la completa (ver `_poll_pending_pick`).
+
+        Args:
+            x: Coordenada X en píxeles (Qt, coordenadas del widget).
+            y: Coordenada Y en píxeles (Qt, coordenadas del widget).
+            callback: Recibe el sticker bajo el cursor o None.
+        """
+        gl_x, gl_y = self._gl_pixel(x, y)
+        if not self.gpu_picking or self.animating or self._outside_cube_on_screen(gl_x, gl_y):
+            callback(self.pick_sticker(x, y))
+            return
+
+        self._begin_pick_gpu(gl_x, gl_y, callback)
+        # El pase de picking sobrescribió parte del framebuffer
+        self.update()
+
+    def _gl_pixel(self, x: int, y: int) -> Tuple[int, int]:
+        """Convierte coordenadas del widget (Qt) a píxel del framebuffer (origen abajo)."""
         dpr = self.devicePixelRatioF()
-        gl_x = int(x * dpr)
-        gl_y = int((self.height() - y - 1) * dpr)
+        return int(x * dpr), int((self.height() - y - 1) * dpr)
 
-        self.makeCurrent()
+    def _pick_ray(self, gl_x: int, gl_y: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Rayo (en coordenadas del cubo) que pasa por el centro de un píxel.
 
-        glDisable(GL_DITHER)
-        glDisable(GL_BLEND)
+        Args:
+            gl_x: Columna del píxel en el framebuffer (origen abajo a la izquierda).
+            gl_y: Fila del píxel en el framebuffer.
 
-        # pass picking
-        glClearColor(0.0, 0.0, 0.0, 1.0)
-        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        Returns:
+            (origen en el plano cercano, dirección hacia el plano lejano), float64.
+        """
+        fb_w, fb_h = self._viewport
+        nx = (gl_x + 0.5) / fb_w * 2.0 - 1.0
+        ny = (gl_y + 0.5) / fb_h * 2.0 - 1.0
+        self._camera_view()
+        inv = self._view_inv @ self._proj_inv
+        near = inv @ np.array([nx, ny, -1.0, 1.0])
+        far = inv @ np.array([nx, ny, 1.0, 1.0])
+        near = near[:3] / near[3]
+        far = far[:3] / far[3]
+        return near, far - near
+
+    def _outside_cube_on_screen(self, gl_x: int, gl_y: int) -> bool:
+        """Indica si el píxel está fuera de la caja en pantalla del cubo (más el radio).
+
+        Permite descartar los clicks en el fondo sin lanzar rayos ni el pase de picking.
 
-        self._apply_camera()
-        mapping = self._draw_all_stickers_pick()
+        Args:
+            gl_x: Columna del píxel en el framebuffer.
+            gl_y: Fila del píxel en el framebuffer.
 
-        glFlush()
+        Returns:
+            True si ningún sticker puede estar bajo el cursor.
+        """
+        bbox = self._cube_screen_bbox()
+        if bbox is None:
+            return False
+        r = self._pick_radius() + 1
+        x0, y0, x1, y1 = bbox
+        return gl_x < x0 - r or gl_x > x1 + r or gl_y < y0 - r or gl_y > y1 + r
 
-        pixel = glReadPixels(gl_x, gl_y, 1, 1, GL_RGB, GL_UNSIGNED_BYTE)
+    def _cube_screen_bbox(self) -> Optional[Tuple[float, float, float, float]]:
+        """Caja (x0, y0, x1, y1) en píxeles de framebuffer de la geometría de picking.
 
-        # restaurar clear color “normal”
-        glClearColor(0.10, 0.10, 0.12, 1.0)
+        Proyecta las 8 esquinas de la caja que envuelve los quads de picking; solo se
+        recalcula si cambió la cámara o el viewport.
 
-        if pixel is None:
-            return None
+        Returns:
+            La caja, o None si alguna esquina queda detrás de la cámara (no se acota).
+        """
+        self._camera_view()
+        if self._screen_bbox_dirty:
+            lo = self._pick_lo.min(axis=0)
+            hi = self._pick_hi.max(axis=0)
+            corners = np.ones((8, 4), dtype=np.float64)
+            corners[:, :3] = np.where(_BOX_CORNERS, hi, lo)
+            clip = corners @ (self._proj.astype(np.float64) @ self._view.astype(np.float64)).T
+            w = clip[:, 3]
+            if (w <= 1e-6).any():
+                self._screen_bbox = None
+            else:
+                fb_w, fb_h = self._viewport
+                px = (clip[:, 0] / w + 1.0) * 0.5 * fb_w
+                py = (clip[:, 1] / w + 1.0) * 0.5 * fb_h
+                self._screen_bbox = (px.min(), py.min(), px.max(), py.max())
+            self._screen_bbox_dirty = False
+        return self._screen_bbox
 
-        if isinstance(pixel, (bytes, bytearray)):
-            r, g, b = pixel[0], pixel[1], pixel[2]
-        else:
-            try:
-                r, g, b = int(pixel[0]), int(pixel[1]), int(pixel[2])
-            except Exception:
-                return None
+    def _pick_radius(self) -> int:
+        """Radio de tolerancia del picking en píxeles de framebuffer (~2 px lógicos)."""
+        return int(2 * self.devicePixelRatioF())
 
-        pick_id = r + (g << 8) + (b << 16)
-        return mapping.get(pick_id, None)
+    def _pick_rect(self, gl_x: int, gl_y: int) -> Tuple[int, int, int, int]:
+        """Rectángulo (x0, y0, ancho, alto) de radio `_pick_radius` alrededor del cursor.
 
-    def _encode_id_color(self, pick_id: int) -> Vec3f:
-        """Codifica un ID entero a un color RGB (0..1) para picking.
+        Se recorta a los límites del viewport.
+        """
+        r = self._pick_radius()
+        fb_w, fb_h = self._viewport
+        x0, y0 = max(0, gl_x - r), max(0, gl_y - r)
+        x1, y1 = min(fb_w, gl_x + r + 1), min(fb_h, gl_y + r + 1)
+        return x0, y0, max(1, x1 - x0), max(1, y1 - y0)
+
+    def _pick_sticker_gpu(self, gl_x: int, gl_y: int) -> Optional[StickerCoord]:
+        """Color picking síncrono: dibuja IDs codificados como color y lee la zona del cursor.
 
         Args:
-            pick_id: Identificador único (1..N) para cada sticker.
+            gl_x: Columna del píxel en el framebuffer.
+            gl_y: Fila del píxel en el framebuffer.
 
         Returns:
-            Tupla (r, g, b) normalizada en rango [0, 1].
+            Sticker más cercano al cursor dentro del radio de tolerancia; None si no hay.
+        """
+        x0, y0, w, h = rect = self._pick_rect(gl_x, gl_y)
+        self._render_pick_pass(rect)
+        # glReadPixels ya sincroniza con el pipeline (no hace falta glFlush)
+        pixels = glReadPixels(x0, y0, w, h, GL_RGBA, GL_UNSIGNED_BYTE)
+        self._end_pick_pass()
+
+        if pixels is None:
+            return None
+        if not isinstance(pixels, (bytes, bytearray)):
+            pixels = np.asarray(pixels, dtype=np.uint8).tobytes()
+
+        return self._pick_mapping.get(_nearest_pick_id(pixels, w, h, gl_x - x0, gl_y - y0))
+
+    def _begin_pick_gpu(self, gl_x: int, gl_y: int, callback: PickCallback) -> None:
+        """Color picking asíncrono: copia la zona del cursor a un PBO sin esperar a la GPU.
+
+        Tras la lectura se inserta un fence; `_poll_pending_pick` lo consulta sin
+        bloquear y resuelve el picking cuando se señaliza. Los PBOs se alternan para no
+        reutilizar uno con una lectura en curso.
+
+        Args:
+            gl_x: Columna del píxel en el framebuffer.
+            gl_y: Fila del píxel en el framebuffer.
+            callback: Recibe el sticker elegido al resolverse la lectura.
+        """
+        # Un click nuevo no deja atrás el anterior: se resuelve primero (puede esperar)
+        if self._pick_pending is not None:
+            self._resolve_pending_pick()
+
+        x0, y0, w, h = rect = self._pick_rect(gl_x, gl_y)
+        self._render_pick_pass(rect)
+
+        pbo = self._pick_pbos[self._pick_pbo_index]
+        self._pick_pbo_index = 1 - self._pick_pbo_index
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, pbo)
+        glBufferData(GL_PIXEL_PACK_BUFFER, w * h * 4, None, GL_STREAM_READ)
+        glReadPixels(x0, y0, w, h, GL_RGBA, GL_UNSIGNED_BYTE, ctypes.c_void_p(0))
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+        # Sin sync objects (GL < 3.2) el PBO se mapea en el primer sondeo
+        fence = glFenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0) if bool(glFenceSync) else None
+        glFlush()
+        self._pick_pending = (pbo, rect, gl_x, gl_y, fence, callback)
+
+        self._end_pick_pass()
+        self._pick_poll_timer.start()
+
+    def _poll_pending_pick(self) -> None:
+        """Tick de `_pick_poll_timer`: resuelve el picking pendiente si la GPU ya terminó."""
+        if self._pick_pending is None:
+            self._pick_poll_timer.stop()
+            return
+
+        fence = self._pick_pending[4]
+        if fence is not None:
+            self.makeCurrent()
+            if glClientWaitSync(fence, 0, 0) == GL_TIMEOUT_EXPIRED:
+                return
+        self._resolve_pending_pick()
+
+    def _resolve_pending_pick(self) -> None:
+        """Lee el PBO del picking asíncrono pendiente y entrega el resultado al callback.
+
+        Si el PBO no se puede mapear, el sticker se resuelve con el picking por rayo.
         """
-        r = (pick_id & 0xFF) / 255.0
-        g = ((pick_id >> 8) & 0xFF) / 255.0
-        b = ((pick_id >> 16) & 0xFF) / 255.0
-        return (r, g, b)
+        if self._pick_pending is None:
+            return
+        pbo, (x0, y0, w, h), gl_x, gl_y, fence, callback = self._pick_pending
+        self._pick_pending = None
+        self._pick_poll_timer.stop()
+
+        self.makeCurrent()
+        if fence is not None:
+            glDeleteSync(fence)
+
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, pbo)
+        ptr = glMapBuffer(GL_PIXEL_PACK_BUFFER, GL_READ_ONLY)
+        pixels = None
+        if ptr:
+            pixels = ctypes.string_at(ptr, w * h * 4)
+            glUnmapBuffer(GL_PIXEL_PACK_BUFFER)
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+
+        if pixels is None:
+            callback(self._pick_sticker_cpu(gl_x, gl_y))
+            return
+        callback(self._pick_mapping.get(_nearest_pick_id(pixels, w, h, gl_x - x0, gl_y - y0)))
+
+    def _render_pick_pass(self, rect: Tuple[int, int, int, int]) -> None:
+        """Dibuja el pase de picking limitado (scissor) al rectángulo `rect` del cursor."""
+        self.makeCurrent()
+        # El pase sobrescribe parte del framebuffer: el próximo paintGL debe redibujar
+        self._drawn_key = None
+
+        glDisable(GL_DITHER)
+        glDisable(GL_BLEND)
+
+        glEnable(GL_SCISSOR_TEST)
+        glScissor(*rect)
+        glClearColor(0.0, 0.0, 0.0, 1.0)
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+
+        self._apply_camera()
+        self._draw_all_stickers_pick()
+
+    def _end_pick_pass(self) -> None:
+        """Restaura el estado modificado por `_render_pick_pass`."""
+        glDisable(GL_SCISSOR_TEST)
+        glClearColor(0.10, 0.10, 0.12, 1.0)
 
     # --------------------------
     # Animación
@@ -361,21 +1231,9 @@ class CubeGLWidget(QOpenGLWidget):
             - layer: -1 | 0 | 1
             - sign_base: +1 o -1 (convención interna)
         """
-        base = move[0].upper()
-        table: Dict[str, Tuple[Axis, int, int]] = {
-            "U": ("y",  1, +1),
-            "D": ("y", -1, -1),
-            "R": ("x",  1, -1),
-            "L": ("x", -1, +1),
-            "F": ("z",  1, -1),
-            "B": ("z", -1, +1),
-            "M": ("x",  0, +1),
-            "E": ("y",  0, -1),
-            "S": ("z",  0, -1),
-        }
-        return table[base]
+        return _MOVE_TABLE[move[0].upper()]
 
-    def _parse_move_for_anim(self, move: str) -> Tuple[Axis, int, int, float, str]:
+    def _parse_move_for_anim(self, move: str) -> AnimParams:
         """Convierte un movimiento a parámetros de animación.
 
         Args:
@@ -407,38 +1265,85 @@ class CubeGLWidget(QOpenGLWidget):
         Args:
             move: Movimiento a animar.
         """
+        params = self._parse_move_for_anim(move)
         if self.animating:
-            self._move_queue.append(move)
+            self._move_queue.append(params)
             return
+        self._start_parsed_animation(params)
 
+    def _start_parsed_animation(self, params: AnimParams, carry_ms: float = 0.0) -> None:
+        """Arranca la animación de un movimiento ya traducido por `_parse_move_for_anim`.
+
+        Args:
+            params: (axis, layer, sign, target, move).
+            carry_ms: Tiempo ya transcurrido del movimiento (sobrante del anterior en
+                la cola); arranca con el ángulo correspondiente.
+        """
         (
             self.anim_axis,
             self.anim_layer,
             self.anim_sign,
             self.anim_target,
             self.anim_move,
-        ) = self._parse_move_for_anim(move)
+        ) = params
 
-        self.anim_angle = 0.0
+        slots = np.flatnonzero(
+            self._slot_layers[:, _AXIS_INDEX[self.anim_axis]] == self.anim_layer
+        )
+        self._anim_slot_mask = np.zeros(54, dtype=bool)
+        self._anim_slot_mask[slots] = True
+        # Quads de plástico y sticker de la capa (mismo slot en ambos bloques)
+        in_layer = np.zeros(_ANIM_QUADS, dtype=bool)
+        in_layer[_PLASTIC_BASE // 4 + slots] = True
+        in_layer[_STICKER_BASE // 4 + slots] = True
+        order = np.concatenate([np.flatnonzero(~in_layer), np.flatnonzero(in_layer)])
+        self._anim_indices = _SCENE_INDICES.reshape(-1, 6)[order].ravel()
+        self._anim_split = int(np.count_nonzero(~in_layer)) * 6
+        self._anim_indices_dirty = True
+
+        self._anim_carry_ms = carry_ms
+        self.anim_angle = min(self.anim_step_per_ms * carry_ms, self.anim_target)
         self.animating = True
-        self._anim_timer.start()
+        self._anim_elapsed.start()
+        if not self._anim_timer.isActive():
+            self._anim_timer.start()
+        self.update()
+
+    def _on_frame_swapped(self) -> None:
+        """Tras presentar un frame: si hay animación, avanza y agenda el siguiente."""
+        if self.animating:
+            self._on_anim_tick()
 
     def _on_anim_tick(self) -> None:
-        """Tick del timer: avanza la animación hasta completar el ángulo objetivo."""
+        """Avanza la animación según el tiempo transcurrido y pide el siguiente frame.
+
+        Lo llaman `_on_frame_swapped` (ritmo de la pantalla) y el timer de respaldo.
+        """
         if not self.animating:
             self._anim_timer.stop()
             return
 
-        self.anim_angle += self.anim_step
+        elapsed_ms = self._anim_elapsed.nsecsElapsed() * 1e-6 + self._anim_carry_ms
+        self.anim_angle = self.anim_step_per_ms * elapsed_ms
         if self.anim_angle >= self.anim_target:
+            # El tiempo que sobrepasa el objetivo pasa al siguiente movimiento de la cola
+            overshoot_ms = elapsed_ms - self.anim_target / self.anim_step_per_ms
             self.anim_angle = self.anim_target
-            self._finish_move_animation()
+            self._finish_move_animation(overshoot_ms)
             return
 
+        # Sin throttle: el próximo frame lo marca la presentación del anterior (vsync)
         self.update()
 
-    def _finish_move_animation(self) -> None:
-        """Finaliza la animación: aplica el movimiento al modelo y emite la señal."""
+    def _finish_move_animation(self, overshoot_ms: float = 0.0) -> None:
+        """Finaliza la animación: aplica el movimiento al modelo y emite la señal.
+
+        Si hay movimientos en cola, el siguiente arranca de inmediato (sin detener el
+        timer) adelantado en `overshoot_ms`.
+
+        Args:
+            overshoot_ms: Tiempo transcurrido más allá del final del movimiento.
+        """
         move = self.anim_move
         if move is None:
             # Estado inesperado: protegemos para evitar crash.
@@ -447,7 +1352,6 @@ class CubeGLWidget(QOpenGLWidget):
             return
 
         self.animating = False
-        self._anim_timer.stop()
 
         self.anim_axis = None
         self.anim_layer = None
@@ -455,6 +1359,7 @@ class CubeGLWidget(QOpenGLWidget):
         self.anim_angle = 0.0
         self.anim_target = 90.0
         self.anim_move = None
+        self._clear_anim_layer()
 
         self.model.apply_move(move)
         self.move_applied.emit(move)
@@ -462,39 +1367,25 @@ class CubeGLWidget(QOpenGLWidget):
         self.update()
 
         if self._move_queue:
-            nxt = self._move_queue.pop(0)
-            self.start_move_animation(nxt)
+            self._start_parsed_animation(self._move_queue.popleft(), overshoot_ms)
+        elif not self.animating:
+            # (un receptor de `move_applied` pudo haber iniciado otra animación)
+            self._anim_timer.stop()
+
+    def _clear_anim_layer(self) -> None:
+        """Olvida la capa animada precalculada en `start_move_animation`."""
+        self._anim_slot_mask = np.zeros(54, dtype=bool)
+        self._anim_indices_dirty = False
 
     # --------------------------
     # Render helpers
     # --------------------------
-    def _rot_point(self, p: Vec3f, axis: Axis, angle_deg: float) -> Vec3f:
-        """Rota un punto alrededor de un eje por un ángulo en grados.
-
-        Args:
-            p: Punto (x, y, z).
-            axis: Eje de rotación ('x', 'y', 'z').
-            angle_deg: Ángulo en grados.
-
-        Returns:
-            Punto rotado (x, y, z).
-        """
-        x, y, z = p
-        a = math.radians(angle_deg)
-        c = math.cos(a)
-        s = math.sin(a)
-
-        if axis == "x":
-            return (x, y * c - z * s, y * s + z * c)
-        if axis == "y":
-            return (x * c + z * s, y, -x * s + z * c)
-        if axis == "z":
-            return (x * c - y * s, x * s + y * c, z)
-        return p
-
     def _sticker_center(self, face: Face, r: int, c: int) -> Vec3f:
         """Centro geométrico de un sticker en una cara (coherente con CubeModel).
 
+        Se evalúa una vez por sticker al construir `_slot_layers`; en caliente se usa
+        esa tabla.
+
         Args:
             face: Cara ("F","B","R","L","U","D").
             r: Fila 0..2.
@@ -517,216 +1408,167 @@ class CubeGLWidget(QOpenGLWidget):
             return (c - 1, -1, 1 - r)
         return (0.0, 0.0, 0.0)
 
-    def _is_in_anim_layer(self, face: Face, r: int, c: int) -> bool:
-        """Indica si un sticker pertenece a la capa animada actual."""
-        if not self.animating or self.anim_axis is None or self.anim_layer is None:
-            return False
-        p = self._sticker_center(face, r, c)
-        idx = {"x": 0, "y": 1, "z": 2}[self.anim_axis]
-        return int(round(p[idx])) == self.anim_layer
+    def _draw_scene(self) -> None:
+        """Dibuja stickers, plástico y highlight desde el VBO de escena.
+
+        Sube los colores de los stickers solo si cambió el estado del modelo y dibuja
+        todo con un único `glMultiDrawElements` (triángulos indexados): el rango
+        plástico + stickers y el quad de highlight del sticker seleccionado. Durante
+        una animación delega en `_draw_animated_scene`.
+        """
+        colors_offset = self._scene_positions.nbytes
 
-    def _sticker_quad(
+        glBindBuffer(GL_ARRAY_BUFFER, self._scene_vbo)
+
+        if self._colors_version != self.model.state_version:
+            self._rebuild_sticker_colors()
+            glBufferSubData(
+                GL_ARRAY_BUFFER,
+                colors_offset + _STICKER_BASE * 4,
+                self._sticker_rgba.nbytes,
+                self._sticker_rgba,
+            )
+            self._colors_version = self.model.state_version
+
+        # Durante un giro el corte entre capas deja ver el interior del cubo: sin culling,
+        # las caras interiores de la cáscara plástica lo cierran
+        if self.animating:
+            glDisable(GL_CULL_FACE)
+        else:
+            glEnable(GL_CULL_FACE)
+
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, None)
+        glColorPointer(4, GL_UNSIGNED_BYTE, 0, ctypes.c_void_p(colors_offset))
+
+        if self.animating and self.anim_axis is not None:
+            self._draw_animated_scene()
+        else:
+            offsets = self._draw_offsets
+            count = self._draw_count
+            if self.selected is not None:
+                quad = _HIGHLIGHT_BASE // 4 + SLOT_INDEX[self.selected]
+                offsets[1] = quad * _QUAD_INDEX_BYTES
+                count[1] = 6
+            else:
+                count[1] = 0
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self._index_ebo)
+            glMultiDrawElements(GL_TRIANGLES, count, GL_UNSIGNED_SHORT, offsets, 2)
+
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+
+    def _draw_animated_scene(self) -> None:
+        """Dibuja la escena con la capa animada girada en GPU.
+
+        Los quads fijos y los de la capa están contiguos en `_anim_ebo` (se suben una
+        vez por movimiento); la capa se dibuja bajo un `glRotatef` sobre la vista, sin
+        tocar las posiciones del VBO. Requiere el VBO de escena y los client states ya
+        activos.
+        """
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self._anim_ebo)
+        if self._anim_indices_dirty:
+            glBufferSubData(
+                GL_ELEMENT_ARRAY_BUFFER, 0, self._anim_indices.nbytes, self._anim_indices
+            )
+            self._anim_indices_dirty = False
+
+        split = self._anim_split
+        glDrawElements(GL_TRIANGLES, split, GL_UNSIGNED_SHORT, None)
+
+        highlight = None
+        if self.selected is not None:
+            quad = _HIGHLIGHT_BASE // 4 + SLOT_INDEX[self.selected]
+            highlight = ctypes.c_void_p(quad * _QUAD_INDEX_BYTES)
+        highlight_in_layer = highlight is not None and bool(
+            self._anim_slot_mask[SLOT_INDEX[self.selected]]
+        )
+
+        glPushMatrix()
+        glRotatef(self.anim_sign * self.anim_angle, *_AXIS_VECTORS[self.anim_axis])
+        glDrawElements(
+            GL_TRIANGLES,
+            _ANIM_INDEX_COUNT - split,
+            GL_UNSIGNED_SHORT,
+            ctypes.c_void_p(split * 2),
+        )
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self._index_ebo)
+        if highlight is not None and highlight_in_layer:
+            glDrawElements(GL_TRIANGLES, 6, GL_UNSIGNED_SHORT, highlight)
+        glPopMatrix()
+
+        if highlight is not None and not highlight_in_layer:
+            glDrawElements(GL_TRIANGLES, 6, GL_UNSIGNED_SHORT, highlight)
+
+    def _build_quads(
         self,
-        face: Face,
-        r: int,
-        c: int,
         margin: float,
         offset: Optional[float] = None,
-    ) -> List[Vec3f]:
-        """Retorna los 4 vértices del quad (sticker) para una cara y celda (r,c).
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Construye los vértices de los 54 stickers en orden de slot.
+
+        Los límites de celda se calculan una vez como arreglos (3, 2) y se
+        difunden por filas/columnas según `_FACE_LAYOUT` (sin bucles por sticker).
 
         Args:
-            face: Cara.
-            r: Fila 0..2.
-            c: Columna 0..2.
             margin: Margen interno del sticker (reduce el quad).
             offset: Offset respecto al cubo (si None, usa `self.sticker_offset`).
+            out: Buffer float32 (216, 3) preasignado donde escribir (opcional).
 
         Returns:
-            Lista de 4 vértices (x, y, z) en orden para dibujar con GL_QUADS.
+            Arreglo float32 (216, 3): 4 vértices consecutivos por sticker (`out` si se dio).
         """
         off = self.sticker_offset if offset is None else offset
-
         step = 2.0 / 3.0
-        m = margin
-
-        # Rangos base por cara (mismo criterio que tu render original)
-        if face == "F":
-            z = 1.0 + off
-            x_min = -1.0 + c * step
-            x_max = x_min + step
-            y_max = 1.0 - r * step
-            y_min = y_max - step
-            return [
-                (x_min + m, y_min + m, z),
-                (x_max - m, y_min + m, z),
-                (x_max - m, y_max - m, z),
-                (x_min + m, y_max - m, z),
-            ]
-
-        if face == "B":
-            z = -1.0 - off
-            x_max = 1.0 - c * step
-            x_min = x_max - step
-            y_max = 1.0 - r * step
-            y_min = y_max - step
-            return [
-                (x_min + m, y_min + m, z),
-                (x_max - m, y_min + m, z),
-                (x_max - m, y_max - m, z),
-                (x_min + m, y_max - m, z),
-            ]
-
-        if face == "R":
-            x = 1.0 + off
-            z_min = -1.0 + c * step
-            z_max = z_min + step
-            y_max = 1.0 - r * step
-            y_min = y_max - step
-            return [
-                (x, y_min + m, z_min + m),
-                (x, y_min + m, z_max - m),
-                (x, y_max - m, z_max - m),
-                (x, y_max - m, z_min + m),
-            ]
-
-        if face == "L":
-            x = -1.0 - off
-            z_max = 1.0 - c * step
-            z_min = z_max - step
-            y_max = 1.0 - r * step
-            y_min = y_max - step
-            return [
-                (x, y_min + m, z_min + m),
-                (x, y_min + m, z_max - m),
-                (x, y_max - m, z_max - m),
-                (x, y_max - m, z_min + m),
-            ]
-
-        if face == "U":
-            y = 1.0 + off
-            z_min = -1.0 + r * step
-            z_max = z_min + step
-            x_min = -1.0 + c * step
-            x_max = x_min + step
-            return [
-                (x_min + m, y, z_min + m),
-                (x_max - m, y, z_min + m),
-                (x_max - m, y, z_max - m),
-                (x_min + m, y, z_max - m),
-            ]
-
-        if face == "D":
-            y = -1.0 - off
-            z_max = 1.0 - r * step
-            z_min = z_max - step
-            x_min = -1.0 + c * step
-            x_max = x_min + step
-            return [
-                (x_min + m, y, z_min + m),
-                (x_max - m, y, z_min + m),
-                (x_max - m, y, z_max - m),
-                (x_min + m, y, z_max - m),
-            ]
-
-        return [(0.0, 0.0, 0.0)] * 4
-
-    def _draw_stickers_pass(self, animated_only: bool) -> None:
-        """Dibuja stickers (y fondo plástico) en un pase.
-
-        Args:
-            animated_only: Si True, dibuja solo los stickers de la capa animada.
-                Si False, dibuja los que NO están en la capa animada.
-        """
-        faces: List[Face] = ["F", "B", "R", "L", "U", "D"]
-
-        glBegin(GL_QUADS)
-
-        for face in faces:
-            for r in range(3):
-                for c in range(3):
-                    in_layer = self._is_in_anim_layer(face, r, c)
-                    if animated_only != in_layer:
-                        continue
-
-                    # Color sticker
-                    color = self.model.state[face][r * 3 + c]
-                    rgb = self._color_rgb(color)
-
-                    # Highlight
-                    if self.selected and self.selected == (face, r, c):
-                        hb = (0.10, 0.95, 0.85)  # calipso
-                        hm = self.sticker_margin * 0.35
-                        quad_h = self._sticker_quad(face, r, c, hm)
-                        if self.animating and in_layer and self.anim_axis is not None:
-                            ang = self.anim_sign * self.anim_angle
-                            quad_h = [self._rot_point(v, self.anim_axis, ang) for v in quad_h]
-                        glColor3f(*hb)
-                        for v in quad_h:
-                            glVertex3f(*v)
-
-                    # --- Base "plástico" detrás del sticker (se anima también) ---
-                    plastic = (0.05, 0.05, 0.06)
-
-                    # Un poco más grande que el sticker y un poco más atrás
-                    quad_bg = self._sticker_quad(
-                        face,
-                        r,
-                        c,
-                        margin=0.02,
-                        offset=self.sticker_offset * 0.55,
-                    )
-
-                    if self.animating and in_layer and self.anim_axis is not None:
-                        ang = self.anim_sign * self.anim_angle
-                        quad_bg = [self._rot_point(v, self.anim_axis, ang) for v in quad_bg]
-
-                    glColor3f(*plastic)
-                    for v in quad_bg:
-                        glVertex3f(*v)
-
-                    # Sticker normal
-                    quad = self._sticker_quad(face, r, c, self.sticker_margin)
-                    if self.animating and in_layer and self.anim_axis is not None:
-                        ang = self.anim_sign * self.anim_angle
-                        quad = [self._rot_point(v, self.anim_axis, ang) for v in quad]
-
-                    glColor3f(*rgb)
-                    for v in quad:
-                        glVertex3f(*v)
-
-        glEnd()
+        k = np.arange(3, dtype=np.float64)
+
+        # Límites [min + m, max - m] por índice de celda, en sentido creciente/decreciente
+        lo_inc = -1.0 + k * step
+        hi_dec = 1.0 - k * step
+        inc = np.stack([lo_inc + margin, lo_inc + step - margin], axis=1)
+        dec = np.stack([hi_dec - step + margin, hi_dec - margin], axis=1)
+
+        # (cara, fila, columna, vértice, xyz)
+        quads = np.empty((6, 3, 3, 4, 3), dtype=np.float64)
+        for f, (n, sign, u, u_inc, v, v_inc, flip) in enumerate(_FACE_LAYOUT):
+            pu, pv = (_QUAD_V, _QUAD_U) if flip else (_QUAD_U, _QUAD_V)
+            quads[f, ..., n] = sign * (1.0 + off)
+            quads[f, ..., u] = (inc if u_inc else dec)[:, pu][None, :, :]
+            quads[f, ..., v] = (inc if v_inc else dec)[:, pv][:, None, :]
+        if out is None:
+            return quads.reshape(-1, 3).astype(np.float32)
+        out[...] = quads.reshape(-1, 3)
+        return out
 
     def _draw_all_stickers_pick(self) -> Dict[int, StickerCoord]:
         """Dibuja todos los stickers con colores codificados y retorna el mapa ID->sticker.
 
+        Usa los VBOs estáticos de picking y los primeros 54 quads del EBO de índices:
+        un único `glDrawElements` sin cambios de color.
+
         Returns:
             Diccionario {pick_id: (face, r, c)}.
         """
-        mapping: Dict[int, StickerCoord] = {}
-        pick_id = 1
-        faces: List[Face] = ["F", "B", "R", "L", "U", "D"]
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
 
-        glBegin(GL_QUADS)
+        glBindBuffer(GL_ARRAY_BUFFER, self._pick_pos_vbo)
+        glVertexPointer(3, GL_FLOAT, 0, None)
+        glBindBuffer(GL_ARRAY_BUFFER, self._pick_color_vbo)
+        glColorPointer(4, GL_UNSIGNED_BYTE, 0, None)
 
-        for face in faces:
-            for r in range(3):
-                for c in range(3):
-                    mapping[pick_id] = (face, r, c)
-                    rgb = self._encode_id_color(pick_id)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self._index_ebo)
+        glDrawElements(GL_TRIANGLES, 54 * 6, GL_UNSIGNED_SHORT, None)
 
-                    quad = self._sticker_quad(
-                        face, r, c, self.sticker_margin + 0.03
-                    )  # área pick un poco más grande
-
-                    glColor3f(*rgb)
-                    for v in quad:
-                        glVertex3f(*v)
-
-                    pick_id += 1
-
-        glEnd()
-        return mapping
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        return self._pick_mapping
 
     # --------------------------
     # Drag => movimiento (camera-aware)
@@ -751,131 +1593,28 @@ class CubeGLWidget(QOpenGLWidget):
         Returns:
             Movimiento en notación (ej: "U", "R'", "E", etc.) o None si no se puede decidir.
         """
-
-        def cross(a: Vec3f, b: Vec3f) -> Vec3f:
-            return (
-                a[1] * b[2] - a[2] * b[1],
-                a[2] * b[0] - a[0] * b[2],
-                a[0] * b[1] - a[1] * b[0],
-            )
-
-        def dot(a: Vec3f, b: Vec3f) -> float:
-            return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
-
-        def norm(v: Vec3f) -> float:
-            return math.sqrt(dot(v, v))
-
-        def scale(v: Vec3f, s: float) -> Vec3f:
-            return (v[0] * s, v[1] * s, v[2] * s)
-
-        def sub(a: Vec3f, b: Vec3f) -> Vec3f:
-            return (a[0] - b[0], a[1] - b[1], a[2] - b[2])
-
-        def sgn(v: float) -> int:
-            return 1 if v > 0 else (-1 if v < 0 else 0)
-
-        FACE_NORMAL: Dict[Face, Vec3f] = {
-            "F": (0.0, 0.0, 1.0),
-            "B": (0.0, 0.0, -1.0),
-            "R": (1.0, 0.0, 0.0),
-            "L": (-1.0, 0.0, 0.0),
-            "U": (0.0, 1.0, 0.0),
-            "D": (0.0, -1.0, 0.0),
-        }
-
-        n = FACE_NORMAL[face]
-        p = self._sticker_center(face, r, c)
-
-        # drag en pantalla => mundo
-        d_world: Vec3f = (dx, -dy, 0.0)
-
-        # mundo -> cubo (inversa de la cámara)
-        yaw = math.radians(self.yaw)
-        pitch = math.radians(self.pitch)
-
-        cx = math.cos(-pitch)
-        sx = math.sin(-pitch)
-        x0, y0, z0 = d_world
-        d1: Vec3f = (x0, cx * y0 - sx * z0, sx * y0 + cx * z0)
-
-        cy = math.cos(-yaw)
-        sy = math.sin(-yaw)
-        x1, y1, z1 = d1
-        d_cube: Vec3f = (cy * x1 + sy * z1, y1, -sy * x1 + cy * z1)
-
-        # proyectar al plano de la cara
-        d_plane = sub(d_cube, scale(n, dot(d_cube, n)))
-        if norm(d_plane) < 1e-6:
-            return None
-
-        axis = cross(n, d_plane)
-
-        ax = [abs(axis[0]), abs(axis[1]), abs(axis[2])]
-        i = ax.index(max(ax))
-        axis_pos: Axis = "xyz"[i]  # type: ignore[assignment]
-        axis_sign = sgn(axis[i])
-
-        layer = int(round(p[i]))
-
-        axis_unit: Vec3f = (
-            (float(axis_sign), 0.0, 0.0)
-            if axis_pos == "x"
-            else (0.0, float(axis_sign), 0.0)
-            if axis_pos == "y"
-            else (0.0, 0.0, float(axis_sign))
+        # drag en pantalla => mundo => cubo (rotación cacheada con la cámara)
+        self._camera_view()
+        d_cube = self._world_to_cube @ (dx, -dy, 0.0)
+        code = _drag_move_code(
+            _FACE_NORMAL[face],
+            tuple(float(v) for v in self._slot_layers[SLOT_INDEX[(face, r, c)]]),
+            (float(d_cube[0]), float(d_cube[1]), float(d_cube[2])),
         )
-        v = cross(axis_unit, p)
-        rot_about_axis_unit = 1 if dot(v, d_plane) > 0 else -1
-        rot_about_pos = rot_about_axis_unit * axis_sign
-
-        # map convención del CubeModel geométrico
-        if axis_pos == "y":
-            if layer == 1:
-                return "U" if rot_about_pos == 1 else "U'"
-            if layer == 0:
-                return "E'" if rot_about_pos == 1 else "E"
-            if layer == -1:
-                return "D'" if rot_about_pos == 1 else "D"
-
-        if axis_pos == "x":
-            if layer == 1:
-                return "R'" if rot_about_pos == 1 else "R"
-            if layer == 0:
-                return "M" if rot_about_pos == 1 else "M'"
-            if layer == -1:
-                return "L" if rot_about_pos == 1 else "L'"
-
-        if axis_pos == "z":
-            if layer == 1:
-                return "F'" if rot_about_pos == 1 else "F"
-            if layer == 0:
-                return "S'" if rot_about_pos == 1 else "S"
-            if layer == -1:
-                return "B" if rot_about_pos == 1 else "B'"
-
-        return None
+        return _DRAG_MOVES[code] if code >= 0 else None
 
     # --------------------------
     # Color map
     # --------------------------
-    def _color_rgb(self, c: str) -> Vec3f:
-        """Convierte el símbolo de color del modelo a RGB.
-
-        Args:
-            c: Letra de color (por ejemplo: "W", "Y", "O", "R", "G", "B").
+    def _rebuild_sticker_colors(self) -> None:
+        """Recalcula `_sticker_rgba` (en su lugar) a partir del estado del modelo.
 
-        Returns:
-            Tupla (r, g, b) en rango [0, 1]. Si no existe el color, retorna gris.
-        """
-        palette: Dict[str, Vec3f] = {
-            "W": (1.0, 1.0, 1.0),
-            "Y": (1.0, 1.0, 0.0),
-            "O": (1.0, 0.5, 0.0),
-            "R": (1.0, 0.0, 0.0),
-            "G": (0.0, 0.85, 0.0),
-            "B": (0.0, 0.35, 1.0),
-        }
-        return palette.get(c, (0.8, 0.8, 0.8))
+        Obtiene los colores de los 216 vértices de stickers con un único indexado
+        de `_COLOR_LUT` por código ASCII de cada sticker (repetido 4 veces por quad).
+        Solo se llama cuando cambia `model.state_version`.
+        """
+        codes = self.model.stickers[_VERTEX_STICKER]
+        np.take(_COLOR_LUT, codes, axis=0, out=self._sticker_rgba)
 
     def cancel_animation(self, clear_queue: bool = True) -> None:
         """Cancela la animación actual y opcionalmente limpia la cola.
@@ -893,12 +1632,13 @@ class CubeGLWidget(QOpenGLWidget):
             self.anim_angle = 0.0
             self.anim_target = 90.0
             self.anim_move = None
+            self._clear_anim_layer()
+
+            self.update()
 
         if clear_queue:
             self._move_queue.clear()
 
-        self.update()
-
     def play_sequence(self, seq: str) -> None:
         """Encola (y ejecuta con animación) una secuencia de movimientos separada por espacios.
 
@@ -908,5 +1648,9 @@ class CubeGLWidget(QOpenGLWidget):
         tokens = [t.strip() for t in seq.split() if t.strip()]
         if not tokens:
             return
-        for t in tokens:
-            self.start_move_animation(t)
+        # Traducir todo una vez, encolar de golpe y arrancar solo el primero (si no hay
+        # animación activa)
+        parsed = [self._parse_move_for_anim(t) for t in tokens]
+        self._move_queue.extend(parsed)
+        if not self.animating:
+            self._start_parsed_animation(self._move_queue.popleft())
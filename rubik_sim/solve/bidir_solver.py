@@ -0,0 +1,160 @@
+# rubik_sim/solve/bidir_solver.py
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+from rubik_sim.core.cube_model import CubeModel
+from rubik_sim.solve.iddfs_solver import (
+    INV,
+    MOVE_ID,
+    MOVES,
+    SOLVED_STATE,
+    OnDepthCallback,
+    ShouldCancelCallback,
+    SolverState,
+    _ALLOWED_MASK,
+    _APPLY_BY_ID,
+    _NO_MOVE,
+    _encode_state,
+)
+
+# Estado -> (estado padre, movimiento que lleva del padre a este estado); None en la raíz
+Visited = Dict[SolverState, Optional[Tuple[SolverState, str]]]
+
+# Cada cuántos estados expandidos se consulta `should_cancel` dentro de una capa
+_CANCEL_POLL_EVERY = 4096
+
+
+def bidir_solve(
+    model: CubeModel,
+    max_depth: int = 6,
+    on_depth: Optional[OnDepthCallback] = None,
+    should_cancel: Optional[ShouldCancelCallback] = None,
+) -> Optional[List[str]]:
+    """Busca una solución con BFS bidireccional (encuentro en el medio).
+
+    Expande por capas dos búsquedas en anchura, una desde el cubo y otra desde el
+    estado resuelto, eligiendo siempre la frontera más pequeña. Cuando un estado
+    nuevo ya fue visitado por el otro lado, se unen ambas rutas. Para una solución de
+    largo `d` se exploran del orden de 2·b^(d/2) estados en lugar de b^d.
+
+    Aplica la misma poda que el IDDFS (no repetir la cara del último movimiento y orden
+    canónico entre caras del mismo eje). La solución encontrada es de largo mínimo.
+
+    Args:
+        model: Cubo a resolver.
+        max_depth: Largo máximo de la solución (suma de ambas búsquedas).
+        on_depth: Callback opcional que se llama con el largo total que se está probando.
+        should_cancel: Callback opcional para cancelar la búsqueda (retorna True si se cancela).
+
+    Returns:
+        Lista de movimientos (notación estándar) si se encuentra solución dentro de
+        `max_depth`; None si no se encuentra o se cancela. Si el cubo ya está
+        resuelto, retorna una lista vacía.
+
+    Notes:
+        - Guarda en memoria todos los estados visitados de ambos lados: con `max_depth`
+          alto (9-10) puede ocupar varios GB.
+    """
+    start = _encode_state(model)
+    if start == SOLVED_STATE:
+        return []
+
+    fwd: Visited = {start: None}
+    bwd: Visited = {SOLVED_STATE: None}
+    fwd_frontier: List[SolverState] = [start]
+    bwd_frontier: List[SolverState] = [SOLVED_STATE]
+
+    for depth in range(1, max_depth + 1):
+        if should_cancel is not None and should_cancel():
+            return None
+
+        if on_depth is not None:
+            on_depth(depth)
+
+        if len(fwd_frontier) <= len(bwd_frontier):
+            frontier, meet = _expand(fwd_frontier, fwd, bwd, should_cancel)
+            if frontier is not None:
+                fwd_frontier = frontier
+        else:
+            frontier, meet = _expand(bwd_frontier, bwd, fwd, should_cancel)
+            if frontier is not None:
+                bwd_frontier = frontier
+
+        if meet is not None:
+            return _path_to(fwd, meet) + _path_from(bwd, meet)
+        if frontier is None:
+            # Cancelado a mitad de capa
+            return None
+
+    return None
+
+
+def _expand(
+    frontier: List[SolverState],
+    seen: Visited,
+    other: Visited,
+    should_cancel: Optional[ShouldCancelCallback] = None,
+) -> Tuple[Optional[List[SolverState]], Optional[SolverState]]:
+    """Expande una capa completa de una de las dos búsquedas.
+
+    Args:
+        frontier: Estados de la última capa de este lado.
+        seen: Visitados de este lado (se actualiza con los estados nuevos).
+        other: Visitados del lado contrario.
+        should_cancel: Callback opcional de cancelación.
+
+    Returns:
+        (nueva frontera, estado de encuentro). El estado de encuentro es None si los
+        lados aún no se tocan; la frontera es None si se canceló la búsqueda.
+    """
+    next_frontier: List[SolverState] = []
+    for k, state in enumerate(frontier):
+        if should_cancel is not None and k % _CANCEL_POLL_EVERY == 0 and should_cancel():
+            return None, None
+
+        link = seen[state]
+        # Poda: otra cara que la del último movimiento, en orden canónico dentro del eje
+        mask = _ALLOWED_MASK[MOVE_ID[link[1]] if link is not None else _NO_MOVE]
+        while mask:
+            low = mask & -mask
+            mask ^= low
+            mv_id = low.bit_length() - 1
+
+            child = bytes(_APPLY_BY_ID[mv_id](state))
+            if child in seen:
+                continue
+
+            seen[child] = (state, MOVES[mv_id])
+            if child in other:
+                return next_frontier, child
+            next_frontier.append(child)
+
+    return next_frontier, None
+
+
+def _path_to(seen: Visited, state: SolverState) -> List[str]:
+    """Movimientos desde la raíz de `seen` hasta `state` (búsqueda hacia adelante)."""
+    moves: List[str] = []
+    link = seen[state]
+    while link is not None:
+        state, mv = link
+        moves.append(mv)
+        link = seen[state]
+    moves.reverse()
+    return moves
+
+
+def _path_from(seen: Visited, state: SolverState) -> List[str]:
+    """Movimientos desde `state` hasta la raíz de `seen` (búsqueda desde el resuelto).
+
+    Cada enlace guarda el movimiento que va de la raíz hacia `state`; recorrerlo en
+    sentido contrario requiere su inverso.
+    """
+    moves: List[str] = []
+    link = seen[state]
+    while link is not None:
+        state, mv = link
+        moves.append(INV[mv])
+        link = seen[state]
+    return moves
@@ -1,12 +1,20 @@
 # rubik_sim/solve/iddfs_solver.py
 from __future__ import annotations
 
-from typing import Callable, Iterable, Optional, Sequence, Set, Tuple, List
+from collections import OrderedDict
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, Optional, Sequence, Set, Tuple, List
+
+import numpy as np
 
 from rubik_sim.core.cube_model import CubeModel
 
-# Tipo del "hash" del cubo. Debe calzar con lo que retorna CubeModel.to_hashable().
-CubeHash = Tuple[Tuple[str, ...], ...]
+try:
+    from numba import njit
+except ImportError:  # numba es opcional: sin él se usa la búsqueda en Python
+    njit = None
+
 OnDepthCallback = Callable[[int], None]
 ShouldCancelCallback = Callable[[], bool]
 
@@ -33,30 +41,289 @@ INV: dict[str, str] = {
 }
 
 
-def _copy_model(model: CubeModel) -> CubeModel:
-    """Crea una copia del modelo del cubo copiando su estado interno.
+# Estado compacto del solver: 54 bytes, un código de color (0..5) por sticker con las
+# caras en el orden de `CubeModel.FACES`. Un movimiento es una permutación de índices
+# (`nuevo[i] = viejo[perm[i]]`), así que el estado es a la vez su propio hash.
+SolverState = bytes
+
+
+def _move_permutation(move: str) -> Tuple[int, ...]:
+    """Permutación de stickers que produce un movimiento (la misma que usa el modelo).
 
     Args:
-        model: Cubo a copiar.
+        move: Movimiento en notación estándar.
 
     Returns:
-        Una nueva instancia de `CubeModel` con el mismo estado.
+        Tupla `perm` de 54 índices tal que `nuevo[i] = viejo[perm[i]]`.
     """
-    c = CubeModel()
-    c.state = {f: list(model.state[f]) for f in model.FACES}
-    return c
+    return tuple(CubeModel.move_permutation(move).tolist())
+
+
+# Movimiento -> función que aplica su permutación (itemgetter recorre los 54 índices en C)
+_APPLY: Dict[str, Callable[[SolverState], Tuple[int, ...]]] = {
+    mv: itemgetter(*_move_permutation(mv)) for mv in MOVES
+}
+
+# Tabla de transposición del IDDFS en Python: estado -> mayor profundidad restante con la
+# que ya se exploró sin éxito. Acotada (LRU) para no crecer sin límite en búsquedas largas.
+TranspositionTable = "OrderedDict[SolverState, int]"
+_TT_MAX_ENTRIES = 500_000
+
+# Resultados de `iddfs_solve` ya calculados: estado -> (solución más corta, o None si no
+# hay ninguna hasta la profundidad guardada; profundidad máxima explorada). LRU acotado.
+_SOLUTION_CACHE: "OrderedDict[SolverState, Tuple[Optional[Tuple[str, ...]], int]]" = OrderedDict()
+_SOLUTION_CACHE_MAX_ENTRIES = 4096
+
+SOLVED_STATE: SolverState = bytes(k for k in range(len(CubeModel.FACES)) for _ in range(9))
+
+# Código ASCII de la letra de color -> código del solver (índice de su cara en `FACES`)
+_COLOR_CODE: np.ndarray = np.zeros(128, dtype=np.uint8)
+for _k, _f in enumerate(CubeModel.FACES):
+    _COLOR_CODE[ord(CubeModel.COLORS_SOLVED[_f])] = _k
+
+
+def _encode_state(model: CubeModel) -> SolverState:
+    """Convierte el estado del modelo al formato compacto del solver.
+
+    Args:
+        model: Cubo a convertir.
 
+    Returns:
+        54 bytes con el código de color de cada sticker (el de la cara a la que
+        pertenece ese color en el cubo resuelto).
+    """
+    return _COLOR_CODE[model.stickers].tobytes()
+
+
+# --------------------------
+# Kernel compilado (numba, opcional)
+# --------------------------
+# Tablas por ID de movimiento (índice en MOVES)
+_FACE_ID: Dict[str, int] = {f: k for k, f in enumerate(dict.fromkeys(mv[0] for mv in MOVES))}
+_MOVE_FACE: np.ndarray = np.array([_FACE_ID[mv[0]] for mv in MOVES], dtype=np.uint8)
+# Eje de giro de cada cara (0 = x, 1 = y, 2 = z): los giros de un mismo eje conmutan
+_FACE_AXIS: Dict[str, int] = {"L": 0, "R": 0, "m": 0, "U": 1, "D": 1, "F": 2, "B": 2, "s": 2}
+_MOVE_AXIS: np.ndarray = np.array([_FACE_AXIS[mv[0]] for mv in MOVES], dtype=np.uint8)
+_PERMS: np.ndarray = np.array([_move_permutation(mv) for mv in MOVES], dtype=np.uint8)
+# `_ALLOWED[último, mv]`: tras un giro solo se permite otro eje o, en el mismo eje, una
+# cara posterior en `_FACE_ID`. Descarta repetir la cara (incluido el inverso) y deja
+# un único orden canónico para caras que conmutan (U D, pero no D U). Toda secuencia
+# tiene una equivalente canónica de igual o menor largo, así que no se pierden soluciones.
+_ALLOWED: np.ndarray = (_MOVE_AXIS[:, None] != _MOVE_AXIS[None, :]) | (
+    _MOVE_FACE[:, None] < _MOVE_FACE[None, :]
+)
+_SOLVED_ARRAY: np.ndarray = np.frombuffer(SOLVED_STATE, dtype=np.uint8).copy()
+
+# Las mismas podas para la búsqueda en Python: por cada último movimiento, una máscara de
+# bits con los IDs permitidos (bit `mv`). El ID `_NO_MOVE` (raíz) los permite todos.
+_NO_MOVE = len(MOVES)
+MOVE_ID: Dict[str, int] = {mv: i for i, mv in enumerate(MOVES)}
+_ALLOWED_MASK: List[int] = [
+    sum(1 << mv for mv in np.flatnonzero(row).tolist()) for row in _ALLOWED
+] + [(1 << len(MOVES)) - 1]
+_APPLY_BY_ID: List[Callable[[SolverState], Tuple[int, ...]]] = [_APPLY[mv] for mv in MOVES]
+
+
+# --------------------------
+# Heurística IDA*: orientación de esquinas
+# --------------------------
+# Proyección del estado: para cada esquina, cuál de sus 3 stickers lleva el color de U o D.
+# Los slices no mueven esquinas y cada giro de cara la cambia a lo más en un paso, así que la
+# distancia a resolver la proyección es una cota inferior admisible (3^7 = 2187 valores).
+_CORNER_FACELETS: np.ndarray = np.array(CubeModel.corner_facelets(), dtype=np.intp)
+_corner_getter = itemgetter(*_CORNER_FACELETS.ravel().tolist())
+_UD_CODES: Tuple[int, int] = (CubeModel.FACES.index("U"), CubeModel.FACES.index("D"))
+# Código de color -> 1 si es U/D; como arreglo para el kernel y como tabla de `bytes.translate`
+_UD_ARRAY: np.ndarray = np.isin(np.arange(256), _UD_CODES).astype(np.int64)
+_UD_TABLE: bytes = _UD_ARRAY.astype(np.uint8).tobytes()
+# Tablas fijas que recibe el kernel (entre `start` y `corner_pdb`)
+_KERNEL_TABLES: Tuple[np.ndarray, ...] = (_PERMS, _ALLOWED, _SOLVED_ARRAY, _CORNER_FACELETS, _UD_ARRAY)
+
+
+def _corner_mask(state: SolverState) -> bytes:
+    """24 bytes (3 por esquina, en el orden de `_CORNER_FACELETS`): 1 si el sticker es U/D."""
+    return bytes(_corner_getter(state)).translate(_UD_TABLE)
+
+
+def _corner_bound(state: SolverState) -> int:
+    """Cota inferior del largo de la solución de `state` según la tabla de esquinas."""
+    return int(_corner_pdb()[1][_corner_mask(state)])
+
+
+def _corner_index(mask: bytes) -> int:
+    """Índice base 3 de una máscara de esquinas (dígito = posición del sticker U/D)."""
+    return sum((mask[3 * k + 1] + 2 * mask[3 * k + 2]) * 3**k for k in range(len(mask) // 3))
+
+
+@lru_cache(maxsize=None)
+def _corner_pdb() -> Tuple[np.ndarray, Dict[bytes, int]]:
+    """BFS desde el estado resuelto sobre la proyección de orientación de esquinas.
+
+    Se construye en el primer `iddfs_solve` (no al importar) y queda memoizada.
 
-def _hash(model: CubeModel) -> CubeHash:
-    """Convierte el estado del cubo a una forma hasheable.
+    Returns:
+        (distancias por `_corner_index`, con 255 en índices inalcanzables;
+         las mismas distancias por máscara de `_corner_mask`).
+    """
+    corner_flat = _CORNER_FACELETS.ravel().tolist()
+    slot = {facelet: j for j, facelet in enumerate(corner_flat)}
+    # Cada movimiento restringido a los 24 stickers de esquina (los slices quedan como identidad)
+    local_perms = {tuple(slot[int(perm[f])] for f in corner_flat) for perm in _PERMS}
+    getters = [itemgetter(*local) for local in local_perms]
+
+    solved = _corner_mask(SOLVED_STATE)
+    dist: Dict[bytes, int] = {solved: 0}
+    frontier = [solved]
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier = []
+        for mask in frontier:
+            for get in getters:
+                child = bytes(get(mask))
+                if child not in dist:
+                    dist[child] = depth
+                    next_frontier.append(child)
+        frontier = next_frontier
+
+    table = np.full(3 ** len(_CORNER_FACELETS), 255, dtype=np.uint8)
+    for mask, d in dist.items():
+        table[_corner_index(mask)] = d
+    return table, dist
+
+
+def _dfs_ids(
+    start: np.ndarray,
+    perms: np.ndarray,
+    allowed: np.ndarray,
+    solved: np.ndarray,
+    corners: np.ndarray,
+    ud: np.ndarray,
+    pdb: np.ndarray,
+    last: int,
+    depth_limit: int,
+    path: np.ndarray,
+) -> int:
+    """DFS limitado en profundidad sobre IDs de movimiento, sin recursión ni objetos.
+
+    Pensado para compilarse con `numba.njit` (solo enteros y arreglos uint8). Los
+    estados de la rama viven en una matriz (una fila por nivel), así que aplicar un
+    movimiento es escribir la fila siguiente y retroceder es bajar de nivel. No usa
+    `seen_on_path`: dentro de IDDFS una rama que repite un estado nunca es la primera
+    solución encontrada (habría una más corta en una iteración anterior).
+
+    Poda IDA*: no desciende a un hijo cuya cota de orientación de esquinas (`pdb`)
+    supera los pasos que le quedan.
 
     Args:
-        model: Cubo a hashear.
+        start: Estado inicial (54 códigos uint8, ver `_encode_state`).
+        perms: Permutaciones por movimiento, uint8 (n_moves, 54).
+        allowed: Podas `allowed[último, mv]`, bool (n_moves, n_moves).
+        solved: Estado resuelto (54 códigos uint8).
+        corners: Índices de los stickers de cada esquina, (8, 3) (ver `_CORNER_FACELETS`).
+        ud: Código de color -> 1 si es el color de U o D, int64 (256,).
+        pdb: Distancias de orientación de esquinas por índice base 3 (ver `_corner_pdb`).
+        last: ID del movimiento que llevó a `start` (para las podas), o -1 en la raíz.
+        depth_limit: Profundidad máxima de esta iteración.
+        path: Salida: IDs de movimiento de la solución (al menos `depth_limit`).
 
     Returns:
-        Una tupla inmutable (hashable) que representa el estado del cubo.
+        Longitud de la solución escrita en `path`, o -1 si no hay ninguna.
     """
-    return model.to_hashable()
+    n_moves = perms.shape[0]
+    n = start.shape[0]
+    states = np.empty((depth_limit + 1, n), dtype=np.uint8)
+    states[0] = start
+    next_move = np.zeros(depth_limit + 1, dtype=np.int64)
+
+    d = 0
+    while d >= 0:
+        mv = next_move[d]
+        if d == depth_limit or mv >= n_moves:
+            d -= 1
+            continue
+        next_move[d] = mv + 1
+        prev = path[d - 1] if d > 0 else last
+        if prev >= 0 and not allowed[prev, mv]:
+            continue
+
+        parent = states[d]
+        child = states[d + 1]
+        is_solved = True
+        for i in range(n):
+            v = parent[perms[mv, i]]
+            child[i] = v
+            if v != solved[i]:
+                is_solved = False
+        path[d] = mv
+        if is_solved:
+            return d + 1
+
+        h_idx = 0
+        weight = 1
+        for k in range(corners.shape[0]):
+            h_idx += (ud[child[corners[k, 1]]] + 2 * ud[child[corners[k, 2]]]) * weight
+            weight *= 3
+        if pdb[h_idx] > depth_limit - d - 1:
+            continue
+
+        d += 1
+        next_move[d] = 0
+    return -1
+
+
+_dfs_compiled = njit(cache=True)(_dfs_ids) if njit is not None else None
+
+# Profundidad restante a partir de la cual una iteración del kernel se reparte por sus
+# primeros movimientos: una llamada de profundidad 7 tarda del orden de décimas de segundo,
+# así que entre llamadas se puede consultar `should_cancel` sin demoras perceptibles
+_KERNEL_CHUNK_DEPTH = 7
+
+
+def _search_compiled(
+    state: np.ndarray,
+    last: int,
+    depth_limit: int,
+    path: np.ndarray,
+    corner_pdb: np.ndarray,
+    should_cancel: Optional[ShouldCancelCallback],
+) -> Optional[int]:
+    """Ejecuta una iteración del kernel compilado, cancelable en búsquedas profundas.
+
+    Si quedan más de `_KERNEL_CHUNK_DEPTH` pasos, expande en Python los primeros
+    movimientos (con las mismas podas que el kernel) y llama al kernel por cada rama,
+    consultando `should_cancel` entre llamadas.
+
+    Args:
+        state: Estado desde el que se busca (54 códigos uint8).
+        last: ID del movimiento que llevó a `state`, o -1 en la raíz.
+        depth_limit: Pasos disponibles desde `state`.
+        path: Salida: IDs de movimiento desde `state` (al menos `depth_limit`).
+        corner_pdb: Tabla de la heurística (ver `_corner_pdb`).
+        should_cancel: Callback opcional de cancelación.
+
+    Returns:
+        Longitud de la solución escrita en `path`, -1 si no hay ninguna, o None si se canceló.
+    """
+    if should_cancel is None or depth_limit <= _KERNEL_CHUNK_DEPTH:
+        return _dfs_compiled(state, *_KERNEL_TABLES, corner_pdb, last, depth_limit, path)
+
+    # Un hijo resuelto sería una solución de largo menor, ya descartada en iteraciones previas
+    for mv in range(len(MOVES)):
+        if last >= 0 and not _ALLOWED[last, mv]:
+            continue
+        if should_cancel():
+            return None
+        child = state[_PERMS[mv]]
+        if corner_pdb[_corner_index(_corner_mask(child.tobytes()))] > depth_limit - 1:
+            continue
+        n = _search_compiled(child, mv, depth_limit - 1, path[1:], corner_pdb, should_cancel)
+        if n is None or n >= 0:
+            if n is not None:
+                path[0] = mv
+                n += 1
+            return n
+    return -1
 
 
 def iddfs_solve(
@@ -69,8 +336,9 @@ def iddfs_solve(
 
     El algoritmo itera el límite de profundidad desde 1 hasta `max_depth`, y en cada
     iteración ejecuta DFS con podas simples para reducir el espacio de búsqueda:
-    - Evita repetir la misma cara consecutivamente (por ejemplo: U seguido de U/U'/U2).
-    - Evita aplicar inmediatamente el inverso del último movimiento.
+    - Evita repetir la misma cara consecutivamente (por ejemplo: U seguido de U/U'/U2),
+      lo que incluye aplicar inmediatamente el inverso del último movimiento.
+    - Caras del mismo eje (que conmutan) solo se recorren en un orden: U D, no D U.
 
     Args:
         model: Cubo a resolver.
@@ -86,12 +354,28 @@ def iddfs_solve(
     Notes:
         - Este solver es útil para scrambles cortos o como demostración educativa.
         - Para scrambles largos, IDDFS se vuelve muy costoso (explosión combinatoria).
+        - Los resultados de búsquedas completas se cachean por estado: repetir la
+          consulta no vuelve a buscar (ni llama a `on_depth`). Las canceladas no se guardan.
     """
     if model.is_solved():
         return []
 
-    start = _copy_model(model)
-    start_hash = _hash(start)
+    start = _encode_state(model)
+    cached = _SOLUTION_CACHE.get(start)
+    if cached is not None:
+        sol, searched = cached
+        if sol is not None or searched >= max_depth:
+            _SOLUTION_CACHE.move_to_end(start)
+            return list(sol) if sol is not None and len(sol) <= max_depth else None
+
+    start_ids = np.frombuffer(start, dtype=np.uint8).copy()
+    corner_pdb, corner_dist = _corner_pdb()
+    # Profundidades menores que la cota no pueden resolverlo
+    min_depth = _corner_bound(start)
+    path_ids = np.zeros(max(max_depth, 1), dtype=np.int64)
+    # Compartida entre iteraciones: un estado que ya falló con igual o más profundidad
+    # restante (por otra rama o en la iteración anterior) no se vuelve a explorar
+    visited: TranspositionTable = OrderedDict()
 
     for depth_limit in range(1, max_depth + 1):
         if should_cancel is not None and should_cancel():
@@ -100,39 +384,79 @@ def iddfs_solve(
         if on_depth is not None:
             on_depth(depth_limit)
 
-        path: List[str] = []
-        seen_on_path: Set[CubeHash] = {start_hash}
+        if depth_limit < min_depth:
+            continue
+
+        if _dfs_compiled is not None:
+            # Con numba la iteración corre compilada; en iteraciones profundas se parte
+            # por los primeros movimientos para poder cancelar (ver `_search_compiled`)
+            n = _search_compiled(start_ids, -1, depth_limit, path_ids, corner_pdb, should_cancel)
+            if n is None:
+                return None
+            if n >= 0:
+                return _remember_solution(start, [MOVES[i] for i in path_ids[:n]], max_depth)
+            continue
+
+        # Ruta de largo fijo: cada nivel escribe su movimiento en `path[depth_idx]`
+        path: List[str] = [""] * depth_limit
+        seen_on_path: Set[SolverState] = {start}
 
         res = _dfs(
             start,
             depth_limit,
             path,
+            0,
             seen_on_path,
-            last_move=None,
+            last_id=_NO_MOVE,
+            visited=visited,
+            corner_dist=corner_dist,
             should_cancel=should_cancel,
         )
         if res is not None:
-            return res
+            return _remember_solution(start, res, max_depth)
 
-    return None
+    if should_cancel is not None and should_cancel():
+        return None
+    return _remember_solution(start, None, max_depth)
+
+
+def _remember_solution(
+    start: SolverState, sol: Optional[List[str]], max_depth: int
+) -> Optional[List[str]]:
+    """Guarda en `_SOLUTION_CACHE` el resultado de una búsqueda completa y lo retorna."""
+    _SOLUTION_CACHE[start] = (tuple(sol) if sol is not None else None, max_depth)
+    _SOLUTION_CACHE.move_to_end(start)
+    if len(_SOLUTION_CACHE) > _SOLUTION_CACHE_MAX_ENTRIES:
+        _SOLUTION_CACHE.popitem(last=False)
+    return sol
 
 
 def _dfs(
-    model: CubeModel,
+    state: SolverState,
     remaining: int,
     path: List[str],
-    seen_on_path: Set[CubeHash],
-    last_move: Optional[str],
+    depth_idx: int,
+    seen_on_path: Set[SolverState],
+    last_id: int,
+    visited: TranspositionTable,
+    corner_dist: Dict[bytes, int],
     should_cancel: Optional[ShouldCancelCallback] = None,
 ) -> Optional[List[str]]:
     """DFS limitado en profundidad para IDDFS.
 
+    Las podas (no repetir la cara del último movimiento y orden canónico del eje) vienen
+    precalculadas en `_ALLOWED_MASK`: solo se recorren los bits de los movimientos
+    permitidos, sin comparar strings.
+
     Args:
-        model: Estado actual del cubo.
+        state: Estado actual del cubo (formato compacto, ver `_encode_state`).
         remaining: Profundidad restante (pasos disponibles).
-        path: Ruta acumulada (movimientos aplicados hasta ahora).
+        path: Ruta preasignada; `path[:depth_idx]` son los movimientos aplicados hasta ahora.
+        depth_idx: Profundidad actual (posición de `path` donde va el siguiente movimiento).
         seen_on_path: Conjunto de estados visitados en la rama actual (evita ciclos).
-        last_move: Último movimiento aplicado (para podas).
+        last_id: ID (índice en `MOVES`) del último movimiento, o `_NO_MOVE` en la raíz.
+        visited: Tabla de transposición (estado -> profundidad restante ya agotada).
+        corner_dist: Cota IDA* por máscara de esquinas (ver `_corner_pdb`).
         should_cancel: Callback opcional de cancelación.
 
     Returns:
@@ -141,45 +465,77 @@ def _dfs(
     if should_cancel is not None and should_cancel():
         return None
 
-    if model.is_solved():
-        return list(path)
+    if state == SOLVED_STATE:
+        return path[:depth_idx]
 
     if remaining == 0:
         return None
 
-    for mv in MOVES:
-        # Poda 1: no repetir la misma cara dos veces seguidas (U luego U/U'/U2)
-        if last_move is not None and mv[0] == last_move[0]:
-            continue
+    # Alias locales: el bucle de abajo corre por cada nodo y las búsquedas de
+    # globales/atributos pesan en CPython
+    apply_by_id = _APPLY_BY_ID
+    moves = MOVES
+    seen_add = seen_on_path.add
+    seen_remove = seen_on_path.remove
+    visited_get = visited.get
+    visited_touch = visited.move_to_end
+    corner_getter = _corner_getter
+    child_remaining = remaining - 1
+    check_tt = remaining > 1
+
+    mask = _ALLOWED_MASK[last_id]
+    while mask:
+        # Bit permitido más bajo = siguiente movimiento, en el orden de MOVES
+        low = mask & -mask
+        mask ^= low
+        mv_id = low.bit_length() - 1
+
+        # El estado hijo es un objeto nuevo de 54 bytes: el del padre sigue intacto en
+        # este frame, así que el backtrack no necesita deshacer el movimiento
+        child = bytes(apply_by_id[mv_id](state))
 
-        # Poda 2: no hacer inmediatamente el inverso del último
-        if last_move is not None and INV.get(last_move) == mv:
+        # Evitar ciclos dentro de la misma rama
+        if child in seen_on_path:
             continue
 
-        child = _copy_model(model)
-        child.apply_move(mv)
-        h = _hash(child)
-
-        # Evitar ciclos dentro de la misma rama
-        if h in seen_on_path:
+        # IDA*: ni la orientación de esquinas alcanza a resolverse en los pasos que quedan
+        if corner_dist[bytes(corner_getter(child)).translate(_UD_TABLE)] > child_remaining:
             continue
 
-        path.append(mv)
-        seen_on_path.add(h)
+        # Transposición: ya se exploró este estado al menos igual de hondo, sin éxito.
+        # Las hojas (sin profundidad restante) no se registran: comprobarlas es más
+        # barato que guardarlas.
+        if check_tt:
+            prev = visited_get(child)
+            if prev is not None and prev >= child_remaining:
+                visited_touch(child)
+                continue
+
+        # Se sobrescribe en la siguiente iteración: el backtrack de `path` es implícito
+        path[depth_idx] = moves[mv_id]
+        seen_add(child)
 
         ans = _dfs(
             child,
-            remaining - 1,
+            child_remaining,
             path,
+            depth_idx + 1,
             seen_on_path,
-            last_move=mv,
+            last_id=mv_id,
+            visited=visited,
+            corner_dist=corner_dist,
             should_cancel=should_cancel,
         )
         if ans is not None:
             return ans
 
+        if check_tt:
+            visited[child] = child_remaining
+            visited_touch(child)
+            if len(visited) > _TT_MAX_ENTRIES:
+                visited.popitem(last=False)
+
         # Backtrack
-        seen_on_path.remove(h)
-        path.pop()
+        seen_remove(child)
 
     return None
@@ -4,101 +4,166 @@ from rubik_sim.core import CubeModel
 
 
 class TestCubeModel(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Cubos compartidos por todos los tests; `setUp` los deja resueltos con `reset`
+        cls._shared = (CubeModel(), CubeModel())
+
+    def setUp(self):
+        self.c, self.c2 = self._shared
+        self.c.reset()
+        self.c2.reset()
+
     def test_starts_solved(self):
         c = CubeModel()
         self.assertTrue(c.is_solved())
 
     def test_U_then_Uprime_returns(self):
-        c = CubeModel()
+        c = self.c
         before = c.to_hashable()
         c.apply_move("U")
         c.apply_move("U'")
         self.assertEqual(before, c.to_hashable())
 
     def test_U2_equals_two_U(self):
-        c1 = CubeModel()
-        c2 = CubeModel()
+        c1, c2 = self.c, self.c2
         c1.apply_move("U2")
         c2.apply_move("U")
         c2.apply_move("U")
         self.assertEqual(c1.to_hashable(), c2.to_hashable())
 
     def test_D_then_Dprime_returns(self):
-        c = CubeModel()
+        c = self.c
         before = c.to_hashable()
         c.apply_move("D")
         c.apply_move("D'")
         self.assertEqual(before, c.to_hashable())
 
     def test_D2_equals_two_D(self):
-        c1 = CubeModel()
-        c2 = CubeModel()
+        c1, c2 = self.c, self.c2
         c1.apply_move("D2")
         c2.apply_move("D")
         c2.apply_move("D")
         self.assertEqual(c1.to_hashable(), c2.to_hashable())
         
     def test_R_then_Rprime_returns(self):
-        c = CubeModel()
+        c = self.c
         before = c.to_hashable()
         c.apply_move("R")
         c.apply_move("R'")
         self.assertEqual(before, c.to_hashable())
 
     def test_L_then_Lprime_returns(self):
-        c = CubeModel()
+        c = self.c
         before = c.to_hashable()
         c.apply_move("L")
         c.apply_move("L'")
         self.assertEqual(before, c.to_hashable())
         
     def test_color_counts_remain_constant(self):
-        c = CubeModel()
+        c = self.c
         # aplica varios movimientos
         c.apply_sequence("R U R' U' L D L' D' U2 R2")
 
-        flat = []
-        for face in c.FACES:
-            flat.extend(c.state[face])
-
         # Cada color debe aparecer 9 veces
-        for color in ["W", "Y", "O", "R", "G", "B"]:
-            self.assertEqual(flat.count(color), 9)
+        self.assertEqual(c.color_counts(), {color: 9 for color in ["W", "Y", "O", "R", "G", "B"]})
 
     def test_F_then_Fprime_returns(self):
-        c = CubeModel()
+        c = self.c
         before = c.to_hashable()
         c.apply_move("F")
         c.apply_move("F'")
         self.assertEqual(before, c.to_hashable())
 
     def test_B_then_Bprime_returns(self):
-        c = CubeModel()
+        c = self.c
         before = c.to_hashable()
         c.apply_move("B")
         c.apply_move("B'")
         self.assertEqual(before, c.to_hashable())
         
     def test_E_then_Eprime_returns(self):
-        c = CubeModel()
+        c = self.c
         before = c.to_hashable()
         c.apply_move("E")
         c.apply_move("E'")
         self.assertEqual(before, c.to_hashable())
 
     def test_M_then_Mprime_returns(self):
-        c = CubeModel()
+        c = self.c
         before = c.to_hashable()
         c.apply_move("M")
         c.apply_move("M'")
         self.assertEqual(before, c.to_hashable())
 
     def test_S_then_Sprime_returns(self):
-        c = CubeModel()
+        c = self.c
         before = c.to_hashable()
         c.apply_move("S")
         c.apply_move("S'")
         self.assertEqual(before, c.to_hashable())
 
+    def test_state_version_changes_on_move_and_reset(self):
+        c = self.c
+        v0 = c.state_version
+        c.apply_move("R")
+        v1 = c.state_version
+        self.assertNotEqual(v0, v1)
+        c.reset()
+        self.assertNotEqual(v1, c.state_version)
+
+    def test_sequence_matches_single_moves(self):
+        c1, c2 = self.c, self.c2
+        seq = "R U2 F' M E S' B L2 D'"
+        c1.apply_sequence(seq)
+        for mv in seq.split():
+            c2.apply_move(mv)
+        self.assertEqual(c1.to_hashable(), c2.to_hashable())
+        self.assertEqual(c1.state, c2.state)
+
+    def test_sequence_cancels_inverse_pairs(self):
+        c = self.c
+        c.apply_move("R")
+        before = c.to_hashable()
+        c.apply_sequence("U F2 F2 U'")
+        self.assertEqual(before, c.to_hashable())
+        c.apply_sequence("F U U' F'")
+        self.assertEqual(before, c.to_hashable())
+
+    def test_state_is_read_only_and_copy_is_independent(self):
+        c = self.c
+        c.apply_move("R")
+        with self.assertRaises(TypeError):
+            c.state["U"][0] = "R"
+        with self.assertRaises(TypeError):
+            c.state["U"] = ["R"] * 9
+        other = c.copy()
+        self.assertEqual(other.to_hashable(), c.to_hashable())
+        other.apply_move("U")
+        self.assertNotEqual(other.to_hashable(), c.to_hashable())
+
+    def test_state_setter_validates_each_face(self):
+        c = self.c
+        c.apply_move("R")
+        before = c.to_hashable()
+        good = {f: list(stickers) for f, stickers in c.state.items()}
+        uneven = dict(good, U=good["U"] + ["W"], D=good["D"][:8])
+        missing = {f: v for f, v in good.items() if f != "B"}
+        bad_letter = dict(good, F=good["F"][:8] + ["1"])
+        for value in (uneven, missing, bad_letter):
+            with self.assertRaises(ValueError):
+                c.state = value
+        self.assertEqual(before, c.to_hashable())
+        c.state = good
+        self.assertEqual(before, c.to_hashable())
+
+    def test_invalid_sequence_leaves_cube_unchanged(self):
+        c = self.c
+        c.apply_move("R")
+        before = c.to_hashable()
+        with self.assertRaises(ValueError):
+            c.apply_sequence("U F X")
+        self.assertEqual(before, c.to_hashable())
+
 if __name__ == "__main__":
     unittest.main()
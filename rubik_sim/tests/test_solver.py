@@ -1,15 +1,122 @@
 import unittest
+from unittest import mock
+
+import numpy as np
+
 from rubik_sim.core.cube_model import CubeModel
-from rubik_sim.solve.iddfs_solver import iddfs_solve
+from rubik_sim.solve import iddfs_solver
+from rubik_sim.solve.bidir_solver import bidir_solve
+from rubik_sim.solve.iddfs_solver import MOVES, iddfs_solve
+
 
 class TestSolver(unittest.TestCase):
-    def test_solver_small_scramble(self):
-        c = CubeModel()
-        c.apply_sequence("R U R' U'")
-        sol = iddfs_solve(c, max_depth=6)
+    def setUp(self):
+        # Cada test parte con la caché de soluciones vacía y la deja como estaba
+        cache = mock.patch.dict(iddfs_solver._SOLUTION_CACHE, clear=True)
+        cache.start()
+        self.addCleanup(cache.stop)
+
+    def assertSolves(self, c, sol):
         self.assertIsNotNone(sol)
+        c = c.copy()
         c.apply_sequence(" ".join(sol))
         self.assertTrue(c.is_solved())
 
+    def test_solver_small_scramble(self):
+        c = CubeModel()
+        c.apply_sequence("R U R' U'")
+        self.assertSolves(c, iddfs_solve(c, max_depth=6))
+
+    def test_every_move_is_solved_in_one_step(self):
+        for mv in MOVES:
+            c = CubeModel()
+            c.apply_move(mv)
+            for solve in (iddfs_solve, bidir_solve):
+                sol = solve(c, max_depth=1)
+                self.assertEqual(len(sol or ()), 1, (mv, solve.__name__))
+                self.assertSolves(c, sol)
+
+    def test_python_search_finds_optimal_solutions(self):
+        # Sin numba: búsqueda en Python con tabla de transposición (pequeña, para que desaloje)
+        scrambles = ("R U F' L", "D2 m B R'", "F U2 s L' D", "R U F L D B")
+        with mock.patch.object(iddfs_solver, "_dfs_compiled", None), \
+                mock.patch.object(iddfs_solver, "_TT_MAX_ENTRIES", 64):
+            for seq in scrambles:
+                c = CubeModel()
+                c.apply_sequence(seq)
+                optimal = bidir_solve(c, max_depth=6)
+                sol = iddfs_solve(c, max_depth=6)
+                self.assertEqual(len(sol or ()), len(optimal), seq)
+                self.assertSolves(c, sol)
+
+    def test_solutions_are_cached_but_cancelled_searches_are_not(self):
+        c = CubeModel()
+        c.apply_sequence("F2 L' D")
+        depths = []
+        self.assertIsNone(iddfs_solve(c, max_depth=3, should_cancel=lambda: True))
+        sol = iddfs_solve(c, max_depth=3, on_depth=depths.append)
+        self.assertEqual(len(sol), 3)
+        self.assertEqual(depths, [1, 2, 3])
+        # Respondidas desde la caché: no vuelven a buscar
+        self.assertEqual(iddfs_solve(c, max_depth=5, on_depth=depths.append), sol)
+        self.assertIsNone(iddfs_solve(c, max_depth=2, on_depth=depths.append))
+        self.assertEqual(depths, [1, 2, 3])
+
+    def test_corner_bound_is_admissible(self):
+        # Interno: la cota de esquinas nunca supera el largo de una solución conocida
+        from rubik_sim.solve.iddfs_solver import _corner_bound, _encode_state
+
+        c = CubeModel()
+        for k, mv in enumerate("R U F' L2 m D B' s".split(), start=1):
+            c.apply_move(mv)
+            self.assertLessEqual(_corner_bound(_encode_state(c)), k)
+
+    def test_iddfs_can_be_cancelled_inside_a_deep_iteration(self):
+        c = CubeModel()
+        c.apply_sequence("R U F' L2 D B R' U2 F L D'")
+        calls = []
+
+        def should_cancel():
+            calls.append(None)
+            return len(calls) > 12
+
+        self.assertIsNone(iddfs_solve(c, max_depth=9, should_cancel=should_cancel))
+
+    def test_bidir_solver_finds_shortest(self):
+        c = CubeModel()
+        c.apply_sequence("R U F L D B")
+        sol = bidir_solve(c, max_depth=7)
+        self.assertEqual(len(sol or ()), 6)
+        self.assertSolves(c, sol)
+
+
+class TestCompiledKernel(unittest.TestCase):
+    """El kernel en Python puro y su versión compilada con numba deben coincidir."""
+
+    def _run_kernel(self, kernel, c, depth):
+        start = np.frombuffer(iddfs_solver._encode_state(c), dtype=np.uint8).copy()
+        path = np.zeros(depth, dtype=np.int64)
+        n = kernel(
+            start, *iddfs_solver._KERNEL_TABLES, iddfs_solver._corner_pdb()[0], -1, depth, path,
+        )
+        return n, [MOVES[i] for i in path[:max(n, 0)]]
+
+    def test_compiled_kernel_matches_python_kernel(self):
+        if iddfs_solver._dfs_compiled is None:
+            self.skipTest("numba no está instalado")
+        for seq in ("R2 m F'", "U L' D2", "F s B' R", "L2 D R' U"):
+            c = CubeModel()
+            c.apply_sequence(seq)
+            for depth in range(1, len(seq.split()) + 1):
+                expected = self._run_kernel(iddfs_solver._dfs_ids, c, depth)
+                self.assertEqual(
+                    self._run_kernel(iddfs_solver._dfs_compiled, c, depth), expected, (seq, depth)
+                )
+            # La solución del kernel resuelve el cubo
+            solved = c.copy()
+            solved.apply_sequence(" ".join(expected[1]))
+            self.assertTrue(solved.is_solved(), seq)
+
+
 if __name__ == "__main__":
     unittest.main()